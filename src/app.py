@@ -426,8 +426,12 @@ def get_digest():
     print("[get_digest] Called. session:", dict(session))
     limit = int(request.args.get('limit', 20))
     offset = int(request.args.get('offset', 0))
+    # Keyset cursor: published_at and id of the last article the client already has
+    before = None
+    if request.args.get('before') and request.args.get('before_id'):
+        before = (request.args['before'], int(request.args['before_id']))
     # Fetch general articles for all users (Only fast section shows personalised articles based on user's interested topics.)
-    articles = content_service.get_general_digest(limit=limit, offset=offset)
+    articles = content_service.get_general_digest(limit=limit, offset=offset, before=before)
     return jsonify({'articles': articles}), 200
 
 @app.route('/api/content/<int:content_id>/read', methods=['POST'])
@@ -13,6 +13,10 @@
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_published_topic 
 ON content(published_at DESC, topic);
 
+-- Index for keyset pagination of the general digest (published_at, id) cursor
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_content_published_id
+ON content(published_at DESC, id DESC);
+
 -- Index for user interactions - speeds up user-specific queries
 CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_content_interactions_user_content 
 ON user_content_interactions(user_id, content_id);
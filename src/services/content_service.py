@@ -15,6 +15,7 @@ Content Classification:
 
 from src.database.connection import get_db_connection, close_db_connection
 from src.models.content import Content
+from src.utils.html_cleaner import clean_html_summary
 from .user_service import get_user_topics
 from typing import List, Optional, Dict, Any, Union
 from psycopg2 import errors as pg_errors
@@ -268,6 +269,91 @@ def build_simple_article_dict(row) -> Dict[str, Any]:
     }
 
 # CONTENT CLASSIFICATION
+
+# Topic keyword tables, compiled once at import
+
+# Open Source keywords
+OPENSOURCE_KEYWORDS = [
+    "open source", "github", "gitlab", "linux", "ubuntu", "debian", "fedora", "arch linux", "red hat", "centos",
+    "apache", "mozilla", "gnu", "copyleft", "mit license", "gpl", "bsd license", "apache license", "eclipse foundation",
+    "fork", "pull request", "contributor", "maintainer", "foss", "oss", "openstack", "kde", "gnome", "freebsd", "openbsd"
+]
+
+# Big Tech & Industry keywords
+BIGTECH_KEYWORDS = [
+    "google", "microsoft", "apple", "amazon", "meta", "facebook", "twitter", "tesla", "nvidia", "intel", "amd", "samsung",
+    "startup", "venture capital", "vc", "funding", "investment", "ipo", "acquisition", "merger", "spinoff", "spac",
+    "silicon valley", "entrepreneur", "business model", "revenue", "unicorn", "series a", "series b", "industry", "market", "stock",
+    "bytedance", "tiktok", "baidu", "alibaba", "xiaomi", "huawei", "oracle", "ibm", "sap", "salesforce", "adobe", "paypal"
+]
+
+# Tech Culture & Work keywords
+CULTURE_KEYWORDS = [
+    "remote work", "work from home", "developer survey", "salary", "job", "career", "hiring", "interview", "workplace", "team",
+    "culture", "burnout", "productivity", "diversity", "inclusion", "tech workers", "engineers", "engineering", "stackoverflow",
+    "stack overflow", "survey", "trends", "skills", "layoff", "fired", "promotion", "onboarding", "exit interview", "work visa"
+]
+
+# AI & ML keywords
+AI_KEYWORDS = [
+    "ai", "artificial intelligence", "machine learning", "ml", "neural network", "deep learning", "nlp", "computer vision",
+    "tensorflow", "pytorch", "chatgpt", "llm", "gpt", "bert", "transformer", "openai", "anthropic", "claude", "gemini", "copilot",
+    "chatbot", "automation", "robotics", "algorithm", "mistral", "llama", "llama 2", "llama 3", "sora", "stable diffusion", "midjourney",
+    "dalle", "dall-e", "slm", "small language model", "large language model", "prompt engineering", "vector db", "embedding", "inference"
+]
+
+# Cybersecurity keywords
+SECURITY_KEYWORDS = [
+    "security", "cybersecurity", "hack", "hacker", "breach", "vulnerability", "exploit", "cve", "encryption", "privacy", "malware",
+    "ransomware", "phishing", "zero-day", "firewall", "antivirus", "vpn", "authentication", "password", "biometric", "two-factor",
+    "ssl", "tls", "pentest", "penetration test", "red team", "blue team", "infosec", "threat", "mitre", "cisa", "nist", "iso 27001",
+    "cryptography", "crypto", "public key", "private key", "certificate", "token", "access control", "siem", "ids", "ips", "forensics",
+    "incident response", "bug bounty", "security audit", "rootkit", "keylogger", "spyware", "trojan", "worm", "backdoor", "botnet",
+    "cyberattack", "cybercrime", "cyberwarfare", "cyber defense", "cyber offense", "zero trust", "mfa", "sso", "xss", "csrf", "sql injection"
+]
+
+# Cloud & DevOps keywords
+CLOUD_KEYWORDS = [
+    "cloud", "aws", "azure", "gcp", "docker", "kubernetes", "devops", "ci/cd", "deployment", "infrastructure", "serverless",
+    "microservices", "containerization", "orchestration", "scalability", "load balancing", "terraform", "ansible", "helm", "istio",
+    "cloudflare", "alb", "elb", "s3", "ec2", "lambda", "cloud run", "cloud function", "cloud storage", "cloud sql", "cloud native",
+    "service mesh", "argo", "argo cd", "prometheus", "grafana", "monitoring", "observability", "opsgenie", "pagerduty"
+]
+
+# Software Development keywords
+DEV_KEYWORDS = [
+    "programming", "coding", "developer", "software", "web development", "javascript", "python", "react", "node.js", "framework",
+    "api", "frontend", "backend", "fullstack", "typescript", "angular", "vue", "php", "ruby", "java", "c++", "rust", "go", "scala",
+    "kotlin", "mobile", "app", "application", "ios", "android", "smartphone", "swift", "objective-c", "flutter", "dart", "svelte",
+    "next.js", "nuxt.js", "express.js", "django", "flask", "spring", "dotnet", ".net", "c#", "perl", "matlab", "assembly", "shell script"
+]
+
+# Data Science keywords
+DATA_KEYWORDS = [
+    "data science", "analytics", "big data", "database", "sql", "visualization", "statistics", "analysis", "pandas", "numpy",
+    "matplotlib", "tableau", "power bi", "data mining", "etl", "data warehouse", "nosql", "mongodb", "postgresql", "mysql",
+    "data lake", "data pipeline", "data engineer", "data analyst", "feature engineering", "data cleaning", "data wrangling",
+    "jupyter", "notebook", "spark", "hadoop", "presto", "snowflake", "redshift", "bigquery", "superset", "looker"
+]
+
+
+def _keyword_pattern(keywords: List[str]) -> "re.Pattern[str]":
+    """Compile a keyword list into one whole-word alternation, matched in a single scan."""
+    return re.compile(r'\b(?:' + '|'.join(re.escape(kw) for kw in keywords) + r')\b', re.IGNORECASE)
+
+
+# Prioritize: security > cloud > open source > ai/ml > bigtech > dev > culture
+TOPIC_KEYWORD_PATTERNS = [
+    (CYBERSECURITY_TOPIC, _keyword_pattern(SECURITY_KEYWORDS)),
+    (CLOUD_DEVOPS_TOPIC, _keyword_pattern(CLOUD_KEYWORDS)),
+    (OPEN_SOURCE_TOPIC, _keyword_pattern(OPENSOURCE_KEYWORDS)),
+    (AI_ML_TOPIC, _keyword_pattern(AI_KEYWORDS)),
+    (BIG_TECH_TOPIC, _keyword_pattern(BIGTECH_KEYWORDS)),
+    (SOFTWARE_DEV_TOPIC, _keyword_pattern(DEV_KEYWORDS)),
+    (TECH_CULTURE_TOPIC, _keyword_pattern(CULTURE_KEYWORDS)),
+]
+
+
 def classify_topic_by_keywords(text: str, title: str) -> str:
     """
     Classify content into tech topics using keyword matching.
@@ -282,91 +368,10 @@ def classify_topic_by_keywords(text: str, title: str) -> str:
     """
     combined_text = (title + " " + text).lower()
 
-    # Open Source keywords 
-    opensource_keywords = [
-        "open source", "github", "gitlab", "linux", "ubuntu", "debian", "fedora", "arch linux", "red hat", "centos",
-        "apache", "mozilla", "gnu", "copyleft", "mit license", "gpl", "bsd license", "apache license", "eclipse foundation",
-        "fork", "pull request", "contributor", "maintainer", "foss", "oss", "openstack", "kde", "gnome", "freebsd", "openbsd"
-    ]
-
-    # Big Tech & Industry keywords 
-    bigtech_keywords = [
-        "google", "microsoft", "apple", "amazon", "meta", "facebook", "twitter", "tesla", "nvidia", "intel", "amd", "samsung",
-        "startup", "venture capital", "vc", "funding", "investment", "ipo", "acquisition", "merger", "spinoff", "spac",
-        "silicon valley", "entrepreneur", "business model", "revenue", "unicorn", "series a", "series b", "industry", "market", "stock",
-        "bytedance", "tiktok", "baidu", "alibaba", "xiaomi", "huawei", "oracle", "ibm", "sap", "salesforce", "adobe", "paypal"
-    ]
-
-    # Tech Culture & Work keywords
-    culture_keywords = [
-        "remote work", "work from home", "developer survey", "salary", "job", "career", "hiring", "interview", "workplace", "team",
-        "culture", "burnout", "productivity", "diversity", "inclusion", "tech workers", "engineers", "engineering", "stackoverflow",
-        "stack overflow", "survey", "trends", "skills", "layoff", "fired", "promotion", "onboarding", "exit interview", "work visa"
-    ]
-
-    # AI & ML keywords 
-    ai_keywords = [
-        "ai", "artificial intelligence", "machine learning", "ml", "neural network", "deep learning", "nlp", "computer vision",
-        "tensorflow", "pytorch", "chatgpt", "llm", "gpt", "bert", "transformer", "openai", "anthropic", "claude", "gemini", "copilot",
-        "chatbot", "automation", "robotics", "algorithm", "mistral", "llama", "llama 2", "llama 3", "sora", "stable diffusion", "midjourney",
-        "dalle", "dall-e", "slm", "small language model", "large language model", "prompt engineering", "vector db", "embedding", "inference"
-    ]
-
-    # Cybersecurity keywords 
-    security_keywords = [
-        "security", "cybersecurity", "hack", "hacker", "breach", "vulnerability", "exploit", "cve", "encryption", "privacy", "malware",
-        "ransomware", "phishing", "zero-day", "firewall", "antivirus", "vpn", "authentication", "password", "biometric", "two-factor",
-        "ssl", "tls", "pentest", "penetration test", "red team", "blue team", "infosec", "threat", "mitre", "cisa", "nist", "iso 27001",
-        "cryptography", "crypto", "public key", "private key", "certificate", "token", "access control", "siem", "ids", "ips", "forensics",
-        "incident response", "bug bounty", "security audit", "rootkit", "keylogger", "spyware", "trojan", "worm", "backdoor", "botnet",
-        "cyberattack", "cybercrime", "cyberwarfare", "cyber defense", "cyber offense", "zero trust", "mfa", "sso", "xss", "csrf", "sql injection"
-    ]
-
-    # Cloud & DevOps keywords 
-    cloud_keywords = [
-        "cloud", "aws", "azure", "gcp", "docker", "kubernetes", "devops", "ci/cd", "deployment", "infrastructure", "serverless",
-        "microservices", "containerization", "orchestration", "scalability", "load balancing", "terraform", "ansible", "helm", "istio",
-        "cloudflare", "alb", "elb", "s3", "ec2", "lambda", "cloud run", "cloud function", "cloud storage", "cloud sql", "cloud native",
-        "service mesh", "argo", "argo cd", "prometheus", "grafana", "monitoring", "observability", "opsgenie", "pagerduty"
-    ]
-
-    # Software Development keywords 
-    dev_keywords = [
-        "programming", "coding", "developer", "software", "web development", "javascript", "python", "react", "node.js", "framework",
-        "api", "frontend", "backend", "fullstack", "typescript", "angular", "vue", "php", "ruby", "java", "c++", "rust", "go", "scala",
-        "kotlin", "mobile", "app", "application", "ios", "android", "smartphone", "swift", "objective-c", "flutter", "dart", "svelte",
-        "next.js", "nuxt.js", "express.js", "django", "flask", "spring", "dotnet", ".net", "c#", "perl", "matlab", "assembly", "shell script"
-    ]
-
-    # Data Science keywords 
-    data_keywords = [
-        "data science", "analytics", "big data", "database", "sql", "visualization", "statistics", "analysis", "pandas", "numpy",
-        "matplotlib", "tableau", "power bi", "data mining", "etl", "data warehouse", "nosql", "mongodb", "postgresql", "mysql",
-        "data lake", "data pipeline", "data engineer", "data analyst", "feature engineering", "data cleaning", "data wrangling",
-        "jupyter", "notebook", "spark", "hadoop", "presto", "snowflake", "redshift", "bigquery", "superset", "looker"
-    ]
-
-    def has_keyword(keywords):
-        for kw in keywords:
-            if re.search(r'\b' + re.escape(kw) + r'\b', combined_text, re.IGNORECASE):
-                return True
-        return False
-
-    # Prioritize: security > cloud > open source > ai/ml > bigtech > dev > culture
-    if has_keyword(security_keywords):
-        return CYBERSECURITY_TOPIC
-    if has_keyword(cloud_keywords):
-        return CLOUD_DEVOPS_TOPIC
-    if has_keyword(opensource_keywords):
-        return OPEN_SOURCE_TOPIC
-    if has_keyword(ai_keywords):
-        return AI_ML_TOPIC
-    if has_keyword(bigtech_keywords):
-        return BIG_TECH_TOPIC
-    if has_keyword(dev_keywords):
-        return SOFTWARE_DEV_TOPIC
-    if has_keyword(culture_keywords):
-        return TECH_CULTURE_TOPIC
+    # Topic patterns are precompiled in priority order
+    for topic, pattern in TOPIC_KEYWORD_PATTERNS:
+        if pattern.search(combined_text):
+            return topic
     return EMERGING_TECH_TOPIC  # Default fallback
 
 # Get article by ID (regardless of user/read status)
@@ -508,6 +513,216 @@ def classify_with_ai(title: str, summary: str) -> Optional[Dict[str, Any]]:
     }
 
 
+# Keyword tables for assign_topic's accept/reject scoring (substring matches)
+TECH_KEYWORDS = [
+    'technology', 'tech', 'software', 'hardware', 'artificial intelligence', 'ai',
+    'machine learning', 'ml', 'programming', 'coding', 'developer', 'development',
+    'computer', 'computing', 'digital', 'internet', 'web', 'app', 'application',
+    'startup', 'silicon valley', 'google', 'microsoft', 'apple', 'amazon', 'meta',
+    'facebook', 'twitter', 'tesla', 'nvidia', 'cybersecurity', 'security',
+    'blockchain', 'cryptocurrency', 'bitcoin', 'cloud', 'data science', 'analytics',
+    'algorithm', 'api', 'database', 'framework', 'open source', 'github', 'linux',
+    'windows', 'android', 'ios', 'mobile', 'smartphone', 'robotics', 'automation',
+    'fintech', 'edtech', 'saas', 'platform', 'gaming', 'virtual reality', 'vr',
+    'augmented reality', 'ar', 'quantum computing', 'semiconductor', 'chip',
+    'processor', 'server', 'network', 'wifi', 'bluetooth', 'electronic', 'device',
+    'python', 'javascript', 'java', 'react', 'node', 'typescript', 'rust', 'go',
+    'kubernetes', 'docker', 'aws', 'azure', 'gcp', 'devops', 'ci/cd', 'agile',
+    'scrum', 'bug', 'feature', 'release', 'version', 'update', 'upgrade', 'patch',
+    'chatbot', 'gpt', 'llm', 'neural', 'model', 'training', 'dataset', 'inference',
+    'survey', 'stackoverflow', 'stack overflow', 'code', 'engineers', 'engineering'
+]
+
+REJECT_KEYWORDS = [
+    # Adult/NSFW content
+    'vibrator', 'sex', 'adult', 'porn', 'explicit', 'nsfw', 'erotic', 'sexual',
+    'nude', 'naked', 'strip', 'escort', 'prostitution', 'xxx',
+    
+    # Promotional/Sales/Marketing content
+    'lifetime subscription', 'lifetime access', 'limited time offer', 'special deal',
+    'discount', 'sale price', 'reg. price', 'half off', 'save money', 'cheap price',
+    'bargain', 'promotion', 'promo code', 'coupon', 'deal of the day', 'flash sale',
+    'subscription service', 'streaming service', 'membership deal', 'annual plan',
+    'get it now', 'buy now', 'order today', 'free trial', 'trial offer',
+    'documentary subscription', 'movie subscription', 'tv subscription',
+    'binge-watching', 'binge watch', 'entertainment subscription',
+    'reg.', 'save $', 'special offer', 'subscription plan',
+    
+    # Entertainment services
+    'curiosity stream', 'netflix', 'hulu', 'disney plus', 'amazon prime video',
+    'paramount plus', 'hbo max', 'apple tv', 'peacock', 'discovery plus',
+    'crunchyroll', 'funimation', 'showtime', 'starz', 'epix',
+    
+    # Government/Policy/Housing/Real Estate
+    'government policy', 'housing policy', 'public housing', 'income ceiling',
+    'eligibility criteria', 'bto', 'built to order', 'hdb', 'housing board',
+    'minister', 'ministry', 'parliament', 'senator', 'congressman', 'mp',
+    'minister says', 'minister said', 'policy review', 'policy under review',
+    'eligibility age review', 'income ceiling review', 'public housing policy',
+    'national development minister', 'housing supply and demand',
+    'national development', 'urban planning', 'housing scheme', 'property prices',
+    'housing supply', 'housing demand', 'affordable housing', 'subsidized housing',
+    'residential property', 'property market', 'real estate market', 'home ownership',
+    'first-time buyers', 'housing grants', 'housing loan', 'mortgage rates',
+    'singles scheme', 'flat application', 'ballot results', 'housing queue',
+    
+    # Sports & Recreation
+    'sports', 'football', 'basketball', 'baseball', 'soccer', 'golf', 'tennis',
+    'hockey', 'rugby', 'cricket', 'swimming', 'racing', 'olympics', 'fifa',
+    'nfl', 'nba', 'mlb', 'athlete', 'stadium', 'tournament', 'championship',
+    
+    # Health & Medical (non-tech)
+    'medical', 'health', 'doctor', 'hospital', 'patient', 'disease', 'virus',
+    'vaccine', 'medicine', 'therapy', 'treatment', 'surgery', 'clinic',
+    'prescription', 'pharmaceutical', 'symptoms', 'diagnosis', 'cancer',
+    'diabetes', 'heart disease', 'mental health', 'depression', 'anxiety',
+    
+    # Lifestyle & Personal
+    'parenting', 'autism', 'disability', 'pregnancy', 'baby', 'children',
+    'marriage', 'wedding', 'divorce', 'relationship', 'dating', 'romance',
+    'family', 'mother', 'father', 'parent', 'kids', 'toddler', 'infant',
+    
+    # Food & Cooking
+    'recipe', 'cooking', 'kitchen', 'restaurant', 'food', 'dining', 'chef',
+    'nutrition', 'diet', 'meal', 'calories', 'ingredients', 'baking',
+    'grocery', 'supermarket', 'fast food', 'delivery', 'takeout',
+    
+    # Fashion & Beauty
+    'fashion', 'beauty', 'makeup', 'skincare', 'clothing', 'style', 'outfit',
+    'jewelry', 'accessories', 'cosmetics', 'perfume', 'hair', 'salon',
+    'designer', 'brand', 'luxury', 'boutique', 'shopping',
+    
+    # Politics & Government (general)
+    'politics', 'election', 'government', 'president', 'senator', 'congress',
+    'parliament', 'democracy', 'republican', 'democrat', 'vote', 'ballot',
+    'campaign', 'policy', 'legislation', 'law', 'court', 'justice', 'legal',
+    
+    # Religion & Spirituality
+    'religion', 'church', 'prayer', 'spiritual', 'bible', 'god', 'faith',
+    'christian', 'muslim', 'jewish', 'buddhist', 'hindu', 'mosque', 'temple',
+    'worship', 'holy', 'sacred', 'divine', 'prophet', 'priest', 'pastor',
+    
+    # Travel & Tourism
+    'travel', 'vacation', 'tourism', 'hotel', 'flight', 'airline', 'airport',
+    'destination', 'cruise', 'resort', 'trip', 'journey', 'adventure',
+    'passport', 'visa', 'booking', 'accommodation', 'sightseeing',
+    
+    # Finance (non-fintech) & Insurance
+    'real estate', 'property', 'mortgage', 'insurance', 'loan', 'debt',
+    'credit card', 'bank account', 'savings', 'retirement', 'pension',
+    'broker', 'realtor', 'apartment', 'house', 'rent', 'lease',
+    'investment advice', 'stock tips', 'forex trading', 'commodity trading',
+    
+    # Entertainment (non-tech)
+    'celebrity', 'entertainment', 'movie', 'film', 'music', 'concert', 'album',
+    'actor', 'actress', 'singer', 'musician', 'band', 'tv show', 'series',
+    'drama', 'comedy', 'horror', 'romance', 'documentary', 'theater',
+    'streaming content', 'video content', 'television', 'cable tv',
+    
+    # Traditional Education (non-edtech)
+    'school', 'teacher', 'student', 'university', 'college', 'classroom',
+    'homework', 'exam', 'grade', 'diploma', 'degree', 'tuition', 'campus',
+    'dormitory', 'scholarship', 'academic', 'curriculum', 'syllabus',
+    
+    # Weather & Environment (non-tech)
+    'weather', 'rain', 'snow', 'storm', 'hurricane', 'tornado', 'flood',
+    'drought', 'temperature', 'climate change', 'global warming', 'pollution',
+    'earthquake', 'tsunami', 'volcano', 'wildfire', 'natural disaster',
+    'air quality', 'outdoor air', 'environmental monitoring', 'atmosphere',
+    'air pollution', 'smog', 'particulate matter', 'pm2.5', 'ozone',
+    
+    # Automotive (non-tech aspects)
+    'car accident', 'traffic jam', 'speeding', 'parking', 'gas station',
+    'oil change', 'tire', 'engine repair', 'mechanic', 'insurance claim',
+    
+    # Agriculture & Farming
+    'farming', 'agriculture', 'crop', 'harvest', 'livestock', 'cattle',
+    'chicken', 'pig', 'farm', 'farmer', 'tractor', 'fertilizer', 'pesticide',
+    
+    # Arts & Crafts
+    'painting', 'drawing', 'sculpture', 'pottery', 'knitting', 'sewing',
+    'craft', 'art gallery', 'museum', 'exhibition', 'artist', 'canvas',
+    
+    # Non-tech DIY and making
+    'welding', 'aluminum welding', 'metalworking', 'woodworking', 'carpentry',
+    'construction', 'building materials', 'diy project', 'handmade', 'crafting',
+    'workshop', 'tools', 'hammer', 'drill', 'saw', 'materials',
+    
+    # Games and puzzles (non-tech)
+    'wordle', 'crossword', 'puzzle', 'game hints', 'game answers', 'strands',
+    'connections', 'nyt games', 'word games', 'brain games', 'sudoku',
+    
+    # Internet services (non-tech business)
+    'internet provider', 'internet service', 'broadband', 'cable', 'fiber internet',
+    'isp', 'home internet', 'wifi plan', 'internet speed', 'internet deals',
+    
+    # Shopping and consumer advice
+    'shopping addiction', 'fake store', 'consumer advice', 'buying guide',
+    'product review', 'best deals', 'shopping tips', 'retail therapy',
+    
+    # News/Current Events (non-tech)
+    'breaking news', 'latest news', 'current events', 'local news', 'world news',
+    'crime news', 'police report', 'court case', 'lawsuit', 'legal battle',
+    'scandal', 'controversy', 'investigation', 'arrest', 'charges filed',
+    
+    # Social Issues (non-tech)
+    'social issues', 'community problems', 'social welfare', 'poverty',
+    'homelessness', 'unemployment', 'social services', 'charity', 'donation',
+    'volunteer work', 'social activism', 'protest', 'demonstration',
+    
+    # Family & Social Services (non-tech)
+    'child abuse', 'child welfare', 'child protection', 'family services',
+    'domestic violence', 'elder abuse', 'social work', 'caseworker',
+    'child safety', 'family support', 'parenting', 'childcare',
+    'adoption', 'foster care', 'custody', 'guardianship',
+    
+    # General News Topics (non-tech)
+    'minister said', 'government said', 'ministry report', 'msf report',
+    'ministry of social', 'social and family development',
+    'high-risk cases', 'abuse cases', 'incident reports',
+    
+    # Content that's clearly promotional or spam-like
+    'tl;dr', 'tldr', 'elevate your', 'get access to', 'exclusive access',
+    'limited offer', 'act now', 'dont miss out', "don't miss out",
+    'while supplies last', 'hurry up', 'last chance', 'final days',
+    'expires soon', 'time sensitive', 'urgent', 'important notice'
+]
+
+
+def _build_keyword_counts():
+    """Map every distinct tech/reject keyword to how often each list contains it."""
+    counts = {}
+    for keyword in TECH_KEYWORDS:
+        tech, reject = counts.get(keyword, (0, 0))
+        counts[keyword] = (tech + 1, reject)
+    for keyword in REJECT_KEYWORDS:
+        tech, reject = counts.get(keyword, (0, 0))
+        counts[keyword] = (tech, reject + 1)
+    return counts
+
+
+# (keyword, tech count, reject count) for each distinct keyword, so shared entries are scanned once
+KEYWORD_COUNTS = tuple((keyword, tech, reject) for keyword, (tech, reject) in _build_keyword_counts().items())
+
+
+def _keyword_scores(text: str) -> tuple[int, int]:
+    """
+    Count the tech and reject keywords that occur in text.
+
+    Args:
+        text: Lowercased title and summary
+
+    Returns:
+        tuple: (tech_score, reject_score), each keyword counted once per list entry
+    """
+    tech_score = reject_score = 0
+    for keyword, tech, reject in KEYWORD_COUNTS:
+        if keyword in text:
+            tech_score += tech
+            reject_score += reject
+    return tech_score, reject_score
+
+
 def assign_topic(title: str, summary: str, return_metadata: bool = False) -> Union[Optional[str], tuple[Optional[str], Dict[str, Any]]]:
     """
     Assigns a topic using keyword rules first, then AI for uncertain cases.
@@ -529,183 +744,8 @@ def assign_topic(title: str, summary: str, return_metadata: bool = False) -> Uni
         'reason': None
     }
     
-    tech_keywords = [
-        'technology', 'tech', 'software', 'hardware', 'artificial intelligence', 'ai',
-        'machine learning', 'ml', 'programming', 'coding', 'developer', 'development',
-        'computer', 'computing', 'digital', 'internet', 'web', 'app', 'application',
-        'startup', 'silicon valley', 'google', 'microsoft', 'apple', 'amazon', 'meta',
-        'facebook', 'twitter', 'tesla', 'nvidia', 'cybersecurity', 'security',
-        'blockchain', 'cryptocurrency', 'bitcoin', 'cloud', 'data science', 'analytics',
-        'algorithm', 'api', 'database', 'framework', 'open source', 'github', 'linux',
-        'windows', 'android', 'ios', 'mobile', 'smartphone', 'robotics', 'automation',
-        'fintech', 'edtech', 'saas', 'platform', 'gaming', 'virtual reality', 'vr',
-        'augmented reality', 'ar', 'quantum computing', 'semiconductor', 'chip',
-        'processor', 'server', 'network', 'wifi', 'bluetooth', 'electronic', 'device',
-        'python', 'javascript', 'java', 'react', 'node', 'typescript', 'rust', 'go',
-        'kubernetes', 'docker', 'aws', 'azure', 'gcp', 'devops', 'ci/cd', 'agile',
-        'scrum', 'bug', 'feature', 'release', 'version', 'update', 'upgrade', 'patch',
-        'chatbot', 'gpt', 'llm', 'neural', 'model', 'training', 'dataset', 'inference',
-        'survey', 'stackoverflow', 'stack overflow', 'code', 'engineers', 'engineering'
-    ]
-    
-    reject_keywords = [
-        # Adult/NSFW content
-        'vibrator', 'sex', 'adult', 'porn', 'explicit', 'nsfw', 'erotic', 'sexual',
-        'nude', 'naked', 'strip', 'escort', 'prostitution', 'xxx',
-        
-        # Promotional/Sales/Marketing content
-        'lifetime subscription', 'lifetime access', 'limited time offer', 'special deal',
-        'discount', 'sale price', 'reg. price', 'half off', 'save money', 'cheap price',
-        'bargain', 'promotion', 'promo code', 'coupon', 'deal of the day', 'flash sale',
-        'subscription service', 'streaming service', 'membership deal', 'annual plan',
-        'get it now', 'buy now', 'order today', 'free trial', 'trial offer',
-        'documentary subscription', 'movie subscription', 'tv subscription',
-        'binge-watching', 'binge watch', 'entertainment subscription',
-        'reg.', 'save $', 'special offer', 'subscription plan',
-        
-        # Entertainment services
-        'curiosity stream', 'netflix', 'hulu', 'disney plus', 'amazon prime video',
-        'paramount plus', 'hbo max', 'apple tv', 'peacock', 'discovery plus',
-        'crunchyroll', 'funimation', 'showtime', 'starz', 'epix',
-        
-        # Government/Policy/Housing/Real Estate
-        'government policy', 'housing policy', 'public housing', 'income ceiling',
-        'eligibility criteria', 'bto', 'built to order', 'hdb', 'housing board',
-        'minister', 'ministry', 'parliament', 'senator', 'congressman', 'mp',
-        'minister says', 'minister said', 'policy review', 'policy under review',
-        'eligibility age review', 'income ceiling review', 'public housing policy',
-        'national development minister', 'housing supply and demand',
-        'national development', 'urban planning', 'housing scheme', 'property prices',
-        'housing supply', 'housing demand', 'affordable housing', 'subsidized housing',
-        'residential property', 'property market', 'real estate market', 'home ownership',
-        'first-time buyers', 'housing grants', 'housing loan', 'mortgage rates',
-        'singles scheme', 'flat application', 'ballot results', 'housing queue',
-        
-        # Sports & Recreation
-        'sports', 'football', 'basketball', 'baseball', 'soccer', 'golf', 'tennis',
-        'hockey', 'rugby', 'cricket', 'swimming', 'racing', 'olympics', 'fifa',
-        'nfl', 'nba', 'mlb', 'athlete', 'stadium', 'tournament', 'championship',
-        
-        # Health & Medical (non-tech)
-        'medical', 'health', 'doctor', 'hospital', 'patient', 'disease', 'virus',
-        'vaccine', 'medicine', 'therapy', 'treatment', 'surgery', 'clinic',
-        'prescription', 'pharmaceutical', 'symptoms', 'diagnosis', 'cancer',
-        'diabetes', 'heart disease', 'mental health', 'depression', 'anxiety',
-        
-        # Lifestyle & Personal
-        'parenting', 'autism', 'disability', 'pregnancy', 'baby', 'children',
-        'marriage', 'wedding', 'divorce', 'relationship', 'dating', 'romance',
-        'family', 'mother', 'father', 'parent', 'kids', 'toddler', 'infant',
-        
-        # Food & Cooking
-        'recipe', 'cooking', 'kitchen', 'restaurant', 'food', 'dining', 'chef',
-        'nutrition', 'diet', 'meal', 'calories', 'ingredients', 'baking',
-        'grocery', 'supermarket', 'fast food', 'delivery', 'takeout',
-        
-        # Fashion & Beauty
-        'fashion', 'beauty', 'makeup', 'skincare', 'clothing', 'style', 'outfit',
-        'jewelry', 'accessories', 'cosmetics', 'perfume', 'hair', 'salon',
-        'designer', 'brand', 'luxury', 'boutique', 'shopping',
-        
-        # Politics & Government (general)
-        'politics', 'election', 'government', 'president', 'senator', 'congress',
-        'parliament', 'democracy', 'republican', 'democrat', 'vote', 'ballot',
-        'campaign', 'policy', 'legislation', 'law', 'court', 'justice', 'legal',
-        
-        # Religion & Spirituality
-        'religion', 'church', 'prayer', 'spiritual', 'bible', 'god', 'faith',
-        'christian', 'muslim', 'jewish', 'buddhist', 'hindu', 'mosque', 'temple',
-        'worship', 'holy', 'sacred', 'divine', 'prophet', 'priest', 'pastor',
-        
-        # Travel & Tourism
-        'travel', 'vacation', 'tourism', 'hotel', 'flight', 'airline', 'airport',
-        'destination', 'cruise', 'resort', 'trip', 'journey', 'adventure',
-        'passport', 'visa', 'booking', 'accommodation', 'sightseeing',
-        
-        # Finance (non-fintech) & Insurance
-        'real estate', 'property', 'mortgage', 'insurance', 'loan', 'debt',
-        'credit card', 'bank account', 'savings', 'retirement', 'pension',
-        'broker', 'realtor', 'apartment', 'house', 'rent', 'lease',
-        'investment advice', 'stock tips', 'forex trading', 'commodity trading',
-        
-        # Entertainment (non-tech)
-        'celebrity', 'entertainment', 'movie', 'film', 'music', 'concert', 'album',
-        'actor', 'actress', 'singer', 'musician', 'band', 'tv show', 'series',
-        'drama', 'comedy', 'horror', 'romance', 'documentary', 'theater',
-        'streaming content', 'video content', 'television', 'cable tv',
-        
-        # Traditional Education (non-edtech)
-        'school', 'teacher', 'student', 'university', 'college', 'classroom',
-        'homework', 'exam', 'grade', 'diploma', 'degree', 'tuition', 'campus',
-        'dormitory', 'scholarship', 'academic', 'curriculum', 'syllabus',
-        
-        # Weather & Environment (non-tech)
-        'weather', 'rain', 'snow', 'storm', 'hurricane', 'tornado', 'flood',
-        'drought', 'temperature', 'climate change', 'global warming', 'pollution',
-        'earthquake', 'tsunami', 'volcano', 'wildfire', 'natural disaster',
-        'air quality', 'outdoor air', 'environmental monitoring', 'atmosphere',
-        'air pollution', 'smog', 'particulate matter', 'pm2.5', 'ozone',
-        
-        # Automotive (non-tech aspects)
-        'car accident', 'traffic jam', 'speeding', 'parking', 'gas station',
-        'oil change', 'tire', 'engine repair', 'mechanic', 'insurance claim',
-        
-        # Agriculture & Farming
-        'farming', 'agriculture', 'crop', 'harvest', 'livestock', 'cattle',
-        'chicken', 'pig', 'farm', 'farmer', 'tractor', 'fertilizer', 'pesticide',
-        
-        # Arts & Crafts
-        'painting', 'drawing', 'sculpture', 'pottery', 'knitting', 'sewing',
-        'craft', 'art gallery', 'museum', 'exhibition', 'artist', 'canvas',
-        
-        # Non-tech DIY and making
-        'welding', 'aluminum welding', 'metalworking', 'woodworking', 'carpentry',
-        'construction', 'building materials', 'diy project', 'handmade', 'crafting',
-        'workshop', 'tools', 'hammer', 'drill', 'saw', 'materials',
-        
-        # Games and puzzles (non-tech)
-        'wordle', 'crossword', 'puzzle', 'game hints', 'game answers', 'strands',
-        'connections', 'nyt games', 'word games', 'brain games', 'sudoku',
-        
-        # Internet services (non-tech business)
-        'internet provider', 'internet service', 'broadband', 'cable', 'fiber internet',
-        'isp', 'home internet', 'wifi plan', 'internet speed', 'internet deals',
-        
-        # Shopping and consumer advice
-        'shopping addiction', 'fake store', 'consumer advice', 'buying guide',
-        'product review', 'best deals', 'shopping tips', 'retail therapy',
-        
-        # News/Current Events (non-tech)
-        'breaking news', 'latest news', 'current events', 'local news', 'world news',
-        'crime news', 'police report', 'court case', 'lawsuit', 'legal battle',
-        'scandal', 'controversy', 'investigation', 'arrest', 'charges filed',
-        
-        # Social Issues (non-tech)
-        'social issues', 'community problems', 'social welfare', 'poverty',
-        'homelessness', 'unemployment', 'social services', 'charity', 'donation',
-        'volunteer work', 'social activism', 'protest', 'demonstration',
-        
-        # Family & Social Services (non-tech)
-        'child abuse', 'child welfare', 'child protection', 'family services',
-        'domestic violence', 'elder abuse', 'social work', 'caseworker',
-        'child safety', 'family support', 'parenting', 'childcare',
-        'adoption', 'foster care', 'custody', 'guardianship',
-        
-        # General News Topics (non-tech)
-        'minister said', 'government said', 'ministry report', 'msf report',
-        'ministry of social', 'social and family development',
-        'high-risk cases', 'abuse cases', 'incident reports',
-        
-        # Content that's clearly promotional or spam-like
-        'tl;dr', 'tldr', 'elevate your', 'get access to', 'exclusive access',
-        'limited offer', 'act now', 'dont miss out', "don't miss out",
-        'while supplies last', 'hurry up', 'last chance', 'final days',
-        'expires soon', 'time sensitive', 'urgent', 'important notice'
-    ]
-    
     # Count no. of tech and reject keywords
-    tech_score = sum(1 for keyword in tech_keywords if keyword in text)
-    reject_score = sum(1 for keyword in reject_keywords if keyword in text)
+    tech_score, reject_score = _keyword_scores(text)
     
     # Calculate rejection and tech signals
     total_rejection_signals = reject_score
@@ -783,18 +823,7 @@ def create_content_item(source_id: int, title: str, summary: str,
         Optional[content]: The created content object if successful, None if article_url already exists.
     """
     # Clean HTML from summary before storing in database
-    import re
-    from bs4 import BeautifulSoup
-    
-    # Multi-stage HTML cleaning
-    clean_soup = BeautifulSoup(summary, "html.parser")
-    cleaned_summary = clean_soup.get_text(separator=" ", strip=True)
-    
-    # Additional regex cleaning for any remaining HTML
-    cleaned_summary = re.sub(r'<[^>]+>', '', cleaned_summary)  # Remove any remaining tags
-    cleaned_summary = re.sub(r'&[a-zA-Z0-9#]+;', ' ', cleaned_summary)  # Remove HTML entities
-    cleaned_summary = re.sub(r'\s+', ' ', cleaned_summary).strip()  # Clean up whitespace
-    cleaned_summary = cleaned_summary.replace('"', '').replace("'", "")  # Remove quotes from attributes
+    cleaned_summary = clean_html_summary(summary)
     
     conn = None
     try:
@@ -849,6 +878,28 @@ def create_content_item(source_id: int, title: str, summary: str,
     finally:
         close_db_connection(conn)
 
+# Result sets larger than this are streamed from a server-side cursor
+STREAM_ROW_THRESHOLD = 200
+STREAM_ITERSIZE = 200
+
+def _open_article_cursor(conn, limit: int):
+    """
+    Opens a cursor sized for the expected result set.
+
+    Args:
+        conn: Open database connection
+        limit (int): Maximum number of rows the query can return
+
+    Returns:
+        tuple: (cursor, streaming); when streaming is True the cursor is a named
+            server-side cursor that fetches rows in batches of STREAM_ITERSIZE
+    """
+    if limit <= STREAM_ROW_THRESHOLD:
+        return conn.cursor(), False
+    cur = conn.cursor(name='articles_stream')
+    cur.itersize = STREAM_ITERSIZE
+    return cur, True
+
 def get_personalized_digest(user_id: int, limit: int = 20, offset: int = 0,
                              include_read: bool = False) -> List[Dict[str, Any]]:
     """
@@ -870,7 +921,7 @@ def get_personalized_digest(user_id: int, limit: int = 20, offset: int = 0,
     digest_items = []
     try:
         conn = get_db_connection()
-        cur = conn.cursor()
+        cur, streaming = _open_article_cursor(conn, limit)
 
         # Base query: Join content with user_content_interactions
         # LEFT JOIN ensures all content items are included, even if no interaction yet
@@ -900,7 +951,7 @@ def get_personalized_digest(user_id: int, limit: int = 20, offset: int = 0,
 
         cur.execute(query, tuple(params))
 
-        for row in cur.fetchall():
+        for row in (cur if streaming else cur.fetchall()):
             # Double-check article still exists (paranoia, but ensures no ghost cards)
             if row[0] is not None:
                 digest_items.append(build_article_dict(row))
@@ -970,7 +1021,7 @@ def get_articles_by_user_topics_extended(user_id: int, topics: list, limit: int
     articles = []
     try:
         conn = get_db_connection()
-        cur = conn.cursor()
+        cur, streaming = _open_article_cursor(conn, limit)
         # Fetch articles from the last 7 days to ensure content availability
         query = """
             SELECT
@@ -991,7 +1042,7 @@ def get_articles_by_user_topics_extended(user_id: int, topics: list, limit: int
             LIMIT %s OFFSET %s;
         """
         cur.execute(query, (user_id, topics, limit, offset))
-        for row in cur.fetchall():
+        for row in (cur if streaming else cur.fetchall()):
             articles.append(build_article_dict(row))
     except Exception as e:
         print(f"Error fetching articles by user topics (extended): {e}")
@@ -1317,14 +1368,17 @@ def cleanup_old_articles():
     finally:
         close_db_connection(conn)
 
-def get_general_digest(limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]:
+def get_general_digest(limit: int = 20, offset: int = 0,
+                       before: Optional[tuple] = None) -> List[Dict[str, Any]]:
     """
     Retrieves a general digest of content items for all users (not personalized).
     Returns the most recent articles from all sources, without user-specific filtering.
 
     Args:
         limit (int): Maximum number of articles to return.
-        offset (int): Offset for pagination.
+        offset (int): Offset for pagination. Ignored when before is given.
+        before (Optional[tuple]): (published_at, id) of the last article already shown.
+            Pages by keyset instead of OFFSET, so deep pages cost the same as the first.
 
     Returns:
         List[Dict[str, Any]]: A list of dictionaries, each representing an article
@@ -1344,10 +1398,15 @@ def get_general_digest(limit: int = 20, offset: int = 0) -> List[Dict[str, Any]]
                 content c
             JOIN
                 sources s ON c.source_id = s.id
-            ORDER BY c.published_at DESC
-            LIMIT %s OFFSET %s;
         """
-        cur.execute(query, (limit, offset))
+        if before is not None:
+            # Keyset pagination: resume right after the last (published_at, id) seen
+            query += " WHERE (c.published_at, c.id) < (%s, %s) ORDER BY c.published_at DESC, c.id DESC LIMIT %s;"
+            params = (before[0], before[1], limit)
+        else:
+            query += " ORDER BY c.published_at DESC, c.id DESC LIMIT %s OFFSET %s;"
+            params = (limit, offset)
+        cur.execute(query, params)
         for row in cur.fetchall():
             digest_items.append(build_simple_article_dict(row))
         # Add an instruction for the user (for frontend display)
@@ -2,10 +2,109 @@
 HTML Content Cleaning and Sanitization Utilities
 Provides safe HTML cleaning for user content and RSS feeds
 """
+import html
+import logging
 import re
-import bleach
+import threading
+from functools import lru_cache
+from bleach.sanitizer import Cleaner
 from bs4 import BeautifulSoup
 
+logger = logging.getLogger(__name__)
+
+# Prefer the C-backed lxml parser, fall back to the stdlib parser if it is not installed
+try:
+    from lxml import etree
+    HTML_PARSER = 'lxml'
+except ImportError:
+    etree = None
+    HTML_PARSER = 'html.parser'
+
+# Elements whose content is never visible text (BeautifulSoup's get_text skips them too)
+_NON_TEXT_TAGS = ('script', 'style', 'template')
+
+# CDATA sections are unwrapped before parsing (libxml2's HTML parser drops their text)
+_CDATA_RE = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+
+# Leftover tags in extracted summary text
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Quote characters are stripped with one str.translate pass
+_QUOTE_TABLE = str.maketrans('', '', '"\'')
+
+
+def _is_plain_text(text):
+    """True when text has no markup, entities or NUL bytes for the parser to rewrite"""
+    return '<' not in text and '&' not in text and '\x00' not in text
+
+
+# lxml parsers must not be used from two threads at once, so each thread gets its own
+_parser_state = threading.local()
+
+
+def _utf8_html_parser():
+    """This thread's lxml HTML parser for UTF-8 encoded input"""
+    parser = getattr(_parser_state, 'parser', None)
+    if parser is None:
+        parser = _parser_state.parser = etree.HTMLParser(encoding='utf-8')
+    return parser
+
+
+def _lxml_text(summary):
+    """Read the visible text straight off the libxml2 tree instead of building a soup"""
+    # Parse UTF-8 bytes: lxml rejects str input that carries an <?xml encoding=...?> declaration
+    root = etree.HTML(summary.encode('utf-8'), _utf8_html_parser())
+    if root is None:
+        return ""
+    for element in root.iter(*_NON_TEXT_TAGS):
+        element.text = None
+        del element[:]
+    return " ".join(text.strip() for text in root.itertext(tag=etree.Element) if text.strip())
+
+
+def _summary_text(summary):
+    """Visible text of an HTML fragment, one space between text nodes"""
+    if not summary:
+        return ""
+    summary = _CDATA_RE.sub(r'\1', summary)
+
+    if etree is not None:
+        try:
+            return _lxml_text(summary)
+        except (ValueError, etree.ParserError) as e:
+            logger.debug("lxml could not parse summary, falling back to BeautifulSoup: %s", e)
+    return BeautifulSoup(summary, 'html.parser').get_text(separator=" ", strip=True)
+
+
+# Republished articles and shared boilerplate repeat the same summaries; the
+# cache is bounded to keep memory predictable on small hosting plans
+@lru_cache(maxsize=1024)
+def clean_html_summary(summary):
+    """
+    Strip markup from an RSS summary before it is stored or classified.
+
+    Results are memoized by summary text.
+
+    Args:
+        summary (str): Raw summary text, possibly containing HTML.
+
+    Returns:
+        str: Plain text with tags, quotes and extra whitespace removed and entities decoded.
+    """
+    # Plain-text summaries have no markup or entities to parse
+    if summary and _is_plain_text(summary):
+        return _WS_RE.sub(' ', summary.translate(_QUOTE_TABLE)).strip()
+
+    # Multi-stage HTML cleaning
+    cleaned_summary = _summary_text(summary)
+
+    # Decode leftover (double-escaped) entities, drop quotes and any remaining tags,
+    # then clean up whitespace
+    cleaned_summary = html.unescape(cleaned_summary).translate(_QUOTE_TABLE)
+    cleaned_summary = _TAG_RE.sub('', cleaned_summary)
+    return _WS_RE.sub(' ', cleaned_summary).strip()
+
 
 class HTMLCleaner:
     """HTML content cleaner and sanitizer"""
@@ -28,9 +127,21 @@ class HTMLCleaner:
         'code': ['class']
     }
     
+    # More restrictive tags for user input
+    USER_ALLOWED_TAGS = ['p', 'br', 'strong', 'b', 'em', 'i']
+    
     def __init__(self):
         """Initialize the HTML cleaner"""
-        pass
+        # bleach Cleaner objects are not thread-safe; each thread builds and reuses its own
+        self._local = threading.local()
+    
+    def _cleaner(self, name, tags, attributes):
+        """This thread's bleach sanitizer for the given whitelist, built on first use"""
+        cleaner = getattr(self._local, name, None)
+        if cleaner is None:
+            cleaner = Cleaner(tags=frozenset(tags), attributes=attributes, strip=True)
+            setattr(self._local, name, cleaner)
+        return cleaner
     
     def clean_html(self, html_content):
         """Clean HTML content using bleach"""
@@ -38,17 +149,10 @@ class HTMLCleaner:
             return ""
             
         # Remove any CDATA sections
-        html_content = re.sub(r'<!\[CDATA\[(.*?)\]\]>', r'\1', html_content, flags=re.DOTALL)
+        html_content = _CDATA_RE.sub(r'\1', html_content)
         
         # Clean with bleach
-        cleaned = bleach.clean(
-            html_content,
-            tags=self.ALLOWED_TAGS,
-            attributes=self.ALLOWED_ATTRIBUTES,
-            strip=True
-        )
-        
-        return cleaned
+        return self._cleaner('content', self.ALLOWED_TAGS, self.ALLOWED_ATTRIBUTES).clean(html_content)
     
     def clean_article_content(self, html_content):
         """Clean article content specifically"""
@@ -63,26 +167,19 @@ class HTMLCleaner:
         if not user_input:
             return ""
             
-        # More restrictive tags for user input
-        user_allowed_tags = ['p', 'br', 'strong', 'b', 'em', 'i']
-        user_allowed_attributes = {}
-        
-        cleaned = bleach.clean(
-            user_input,
-            tags=user_allowed_tags,
-            attributes=user_allowed_attributes,
-            strip=True
-        )
-        
-        return cleaned
+        return self._cleaner('user', self.USER_ALLOWED_TAGS, {}).clean(user_input)
     
     def extract_text(self, html_content):
         """Extract plain text from HTML"""
         if not html_content:
             return ""
+
+        # Nothing to parse in plain text (the parser would also normalise line endings)
+        if _is_plain_text(html_content) and '\r' not in html_content:
+            return html_content.strip()
             
         # Use BeautifulSoup to extract text
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         return soup.get_text(strip=True, separator=' ')
     
     def clean_and_extract_summary(self, html_content, max_length=200):
@@ -0,0 +1,17 @@
+"""
+Shared fixtures for the accessibility tests
+
+The Flask client fixtures (``shared_client``, ``client`` and
+``authenticated_client``) live in the top-level tests/conftest.py.
+"""
+
+import pytest
+from bs4 import BeautifulSoup
+
+
+@pytest.fixture(scope="session")
+def login_page(shared_client):
+    """Fetch and parse the logged-out /login page once for the session"""
+    shared_client.delete_cookie(shared_client.application.config['SESSION_COOKIE_NAME'])
+    response = shared_client.get('/login')
+    return BeautifulSoup(response.data, 'html.parser')
@@ -10,45 +10,27 @@ Tests WCAG compliance and accessibility features including:
 """
 
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch
 import re
 from bs4 import BeautifulSoup
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
-from src.app import app
+# Focusable elements with tabindex="-1", combined into one selector group
+_FOCUSABLE_SELECTORS = ('input', 'button', 'a[href]', 'select', 'textarea')
+_UNFOCUSABLE_SELECTOR = ', '.join(f'{selector}[tabindex="-1"]' for selector in _FOCUSABLE_SELECTORS)
 
 
+@pytest.mark.accessibility
+@pytest.mark.slow
 class TestAccessibility:
     """Accessibility tests for WCAG compliance"""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client"""
-        app.config['TESTING'] = True
-        app.config['WTF_CSRF_ENABLED'] = False
-        with app.test_client() as client:
-            yield client
-
-    @pytest.fixture
-    def authenticated_client(self, client):
-        """Create authenticated test client"""
-        with client.session_transaction() as sess:
-            sess['user_id'] = 1
-            sess['username'] = 'testuser'
-        return client
-
     def parse_html(self, html_content):
         """Parse HTML content for testing"""
         return BeautifulSoup(html_content, 'html.parser')
 
-    def test_html_lang_attribute(self, client):
+    def test_html_lang_attribute(self, login_page):
         """Test that HTML has lang attribute for screen readers"""
-        response = client.get('/login')
-        soup = self.parse_html(response.data)
+        soup = login_page
         
         html_tag = soup.find('html')
         assert html_tag is not None
@@ -84,33 +66,33 @@ class TestAccessibility:
         nav_elements = soup.find_all('nav')
         assert len(nav_elements) > 0, "Page should have navigation landmarks"
 
-    def test_form_labels_and_accessibility(self, client):
+    def test_form_labels_and_accessibility(self, login_page):
         """Test form accessibility features"""
         # Test login form
-        response = client.get('/login')
-        soup = self.parse_html(response.data)
+        soup = login_page
         
         # Find all input fields
         inputs = soup.find_all('input', {'type': ['text', 'email', 'password']})
+        labelled_ids = {label.get('for') for label in soup.find_all('label', attrs={'for': True})}
         
-        for input_field in inputs:
-            input_id = input_field.get('id')
-            input_name = input_field.get('name')
-            
-            if input_id:
-                # Check for associated label
-                label = soup.find('label', {'for': input_id})
-                assert label is not None, f"Input {input_id} should have an associated label"
-            
-            # Check for required fields having proper attributes
-            if input_field.get('required'):
-                aria_required = input_field.get('aria-required')
-                assert aria_required == 'true', f"Required input should have aria-required='true'"
+        # Collect every problem so one run reports all of them
+        violations = [
+            f"- Input {input_field.get('id')} should have an associated label"
+            for input_field in inputs
+            if input_field.get('id') and input_field.get('id') not in labelled_ids
+        ]
+        violations.extend(
+            f"- Required input {input_field.get('id') or input_field.get('name')} should have aria-required='true'"
+            for input_field in inputs
+            if input_field.get('required') and input_field.get('aria-required') != 'true'
+        )
+        
+        if violations:
+            pytest.fail("Form accessibility violations found:\n" + "\n".join(violations))
 
-    def test_button_accessibility(self, client):
+    def test_button_accessibility(self, login_page):
         """Test button accessibility features"""
-        response = client.get('/login')
-        soup = self.parse_html(response.data)
+        soup = login_page
         
         buttons = soup.find_all('button')
         
@@ -151,10 +133,9 @@ class TestAccessibility:
             if aria_pressed:
                 assert aria_pressed in ['true', 'false']
 
-    def test_heading_hierarchy(self, client):
+    def test_heading_hierarchy(self, login_page):
         """Test proper heading hierarchy (h1, h2, h3, etc.)"""
-        response = client.get('/login')
-        soup = self.parse_html(response.data)
+        soup = login_page
         
         # Find all headings
         headings = soup.find_all(re.compile(r'^h[1-6]$'))
@@ -181,23 +162,19 @@ class TestAccessibility:
             response = client.get(page)
             soup = self.parse_html(response.data)
             
-            images = soup.find_all('img')
+            # All images should have alt attribute (can be empty for decorative)
+            missing_alt = [img.get('src') for img in soup.select('img:not([alt])')]
+            assert not missing_alt, f"Images {missing_alt} should have alt attribute"
             
-            for img in images:
-                alt_text = img.get('alt')
+            # Non-decorative images should have meaningful alt text
+            for img in soup.select('img[alt]'):
                 src = img.get('src')
-                
-                # All images should have alt attribute (can be empty for decorative)
-                assert alt_text is not None, f"Image {src} should have alt attribute"
-                
-                # Non-decorative images should have meaningful alt text
                 if not any(keyword in src.lower() for keyword in ['logo', 'icon', 'decoration']):
-                    assert len(alt_text.strip()) > 0, f"Content image {src} should have descriptive alt text"
+                    assert len(img['alt'].strip()) > 0, f"Content image {src} should have descriptive alt text"
 
-    def test_link_accessibility(self, client):
+    def test_link_accessibility(self, login_page):
         """Test link accessibility features"""
-        response = client.get('/login')
-        soup = self.parse_html(response.data)
+        soup = login_page
         
         links = soup.find_all('a')
         
@@ -269,30 +246,20 @@ class TestAccessibility:
                     target_element = soup.find(id=target_id)
                     assert target_element is not None, f"Skip link target {target_id} should exist"
 
-    def test_focus_indicators(self, client):
+    def test_focus_indicators(self, login_page):
         """Test that focusable elements can receive focus"""
-        response = client.get('/login')
-        soup = self.parse_html(response.data)
-        
-        # Find focusable elements
-        focusable_selectors = ['input', 'button', 'a[href]', 'select', 'textarea']
+        soup = login_page
         
-        for selector in focusable_selectors:
-            elements = soup.select(selector)
-            
-            for element in elements:
-                # Elements should not have tabindex="-1" unless intentional
-                tabindex = element.get('tabindex')
-                if tabindex == '-1':
-                    # Should have a good reason (like being in a modal or dropdown)
-                    classes = element.get('class', [])
-                    assert any(cls in ['modal', 'dropdown', 'hidden'] for cls in classes), \
-                           "Elements with tabindex='-1' should be in modals or hidden"
+        # Focusable elements taken out of the tab order, in a single selector pass
+        for element in soup.select(_UNFOCUSABLE_SELECTOR):
+            # Should have a good reason (like being in a modal or dropdown)
+            classes = element.get('class', [])
+            assert any(cls in ['modal', 'dropdown', 'hidden'] for cls in classes), \
+                   "Elements with tabindex='-1' should be in modals or hidden"
 
-    def test_color_contrast_indicators(self, client):
+    def test_color_contrast_indicators(self, login_page):
         """Test for potential color contrast issues"""
-        response = client.get('/login')
-        soup = self.parse_html(response.data)
+        soup = login_page
         
         # Look for inline styles that might cause contrast issues
         elements_with_style = soup.find_all(style=True)
@@ -362,10 +329,9 @@ class TestAccessibility:
                     if role:
                         assert role in ['alert', 'status', 'log']
 
-    def test_keyboard_navigation_attributes(self, client):
+    def test_keyboard_navigation_attributes(self, login_page):
         """Test keyboard navigation support"""
-        response = client.get('/login')
-        soup = self.parse_html(response.data)
+        soup = login_page
         
         # Check for keyboard event handlers
         elements_with_events = soup.find_all(attrs={'onkeydown': True, 'onkeyup': True, 'onkeypress': True})
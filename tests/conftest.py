@@ -0,0 +1,108 @@
+"""
+Shared pytest configuration for the test suite
+
+Puts src/ on sys.path once per session so individual test modules
+don't need to patch the import path themselves, and registers the test
+markers so ``pytest -m "not slow"`` can skip the full-page suites.
+
+Also provides the Flask client fixtures: one test client is created for the
+whole session instead of one per test, and the per-test ``client`` fixture
+drops the session cookie so tests still start logged out. ``auth_factory``
+logs that client in as a given user from a cached signed cookie. The session
+client also compiles every Jinja template once when it is created.
+"""
+
+import sys
+import pathlib
+import warnings
+
+import pytest
+from unittest.mock import Mock
+
+# Add src to path for imports
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / 'src'))
+
+
+def pytest_configure(config):
+    """Register the markers used to select test categories"""
+    config.addinivalue_line("markers", "accessibility: Accessibility tests")
+    config.addinivalue_line("markers", "slow: Slow running tests (full page renders)")
+
+
+@pytest.fixture(scope="session")
+def shared_client():
+    """Create a single test client for the whole test session"""
+    # Imported here so service-only runs never load the Flask app
+    from src.app import app
+
+    app.config['TESTING'] = True
+    app.config['WTF_CSRF_ENABLED'] = False
+    # Templates never change mid-run, so skip debug mode's per-render mtime check
+    app.config['TEMPLATES_AUTO_RELOAD'] = False
+    app.jinja_env.auto_reload = False
+    # Compile every template up front so no test pays a first-render penalty
+    for template in app.jinja_env.list_templates():
+        try:
+            app.jinja_env.get_template(template)
+        except Exception as e:
+            warnings.warn(f"Could not precompile template {template}: {e}")
+    with app.test_client() as client:
+        yield client
+
+
+@pytest.fixture
+def client(shared_client):
+    """Return the shared test client with an empty session"""
+    shared_client.delete_cookie(shared_client.application.config['SESSION_COOKIE_NAME'])
+    return shared_client
+
+
+@pytest.fixture(scope="session")
+def auth_cookies():
+    """Signed session cookie values, keyed by (user_id, username)"""
+    return {}
+
+
+@pytest.fixture
+def auth_factory(client, auth_cookies):
+    """
+    Log the test client in as any user.
+
+    ``auth_factory(user_id, username)`` returns the client carrying a signed
+    session cookie for that user. Each user's cookie is signed through
+    session_transaction once per test session and reused afterwards.
+    """
+    cookie_name = client.application.config['SESSION_COOKIE_NAME']
+
+    def make(user_id=1, username='testuser'):
+        key = (user_id, username)
+        if key not in auth_cookies:
+            with client.session_transaction() as sess:
+                sess['user_id'] = user_id
+                sess['username'] = username
+            auth_cookies[key] = client.get_cookie(cookie_name).value
+        client.set_cookie(cookie_name, auth_cookies[key])
+        return client
+    return make
+
+
+@pytest.fixture
+def authenticated_client(auth_factory):
+    """Create authenticated test client"""
+    return auth_factory()
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    """
+    Swap a module attribute for a plain Mock for the length of one test.
+
+    ``stub(module, 'name', return_value)`` returns the installed Mock. It is a
+    direct attribute swap through monkeypatch, and a plain Mock is much cheaper
+    to build than the MagicMock that ``patch`` creates.
+    """
+    def install(target, name, return_value=None):
+        mock = Mock(return_value=return_value)
+        monkeypatch.setattr(target, name, mock)
+        return mock
+    return install
@@ -9,15 +9,9 @@ Tests end-to-end functionality including:
 """
 
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
-import json
 import tempfile
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from src.app import app
 from src.services import user_service, content_service, source_service
 
@@ -271,7 +265,7 @@ class TestIntegrationFlows:
         response = client.get('/api/sources')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert len(data) == 2
         assert data[0]['name'] == 'TechCrunch'
 
@@ -385,7 +379,7 @@ class TestIntegrationFlows:
         response = client.get('/api/digest')
         assert response.status_code == 200
         
-        data = json.loads(response.data)
+        data = response.get_json()
         assert len(data) == 2
         assert 'Digest Article' in data[0]['title']
 
@@ -143,6 +143,7 @@ def install_dependencies():
     dependencies = [
         'pytest',
         'pytest-cov',
+        'pytest-xdist',
         'beautifulsoup4',
         'mock'
     ]
@@ -207,6 +208,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Coverage is opt-in; on Python 3.12+ trace with sys.monitoring (PEP 669) instead of sys.settrace
+    if args.coverage and sys.version_info >= (3, 12):
+        os.environ.setdefault('COVERAGE_CORE', 'sysmon')
+    
     # Change to script directory
     os.chdir(Path(__file__).parent)
     
@@ -10,14 +10,9 @@ Tests all functions in the content service including:
 """
 
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime, timedelta
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from src.services import content_service
 from src.models.content import Content
 
@@ -224,6 +219,28 @@ class TestContentService:
         assert digest[0]['title'] == 'Test Article'
         mock_cursor.execute.assert_called()
 
+    @patch('src.services.content_service.get_db_connection')
+    @patch('src.services.content_service.close_db_connection')
+    def test_get_personalized_digest_streams_large_limits(self, mock_close_conn, mock_get_conn):
+        """Test large digests iterate a server-side cursor instead of fetchall"""
+        mock_conn = Mock()
+        mock_cursor = MagicMock()
+        mock_get_conn.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.__iter__.return_value = iter([
+            (1, 1, 'Test Article', 'Summary', 'https://example.com', datetime.now(), 'AI & ML',
+             'https://example.com/image.jpg', False, False, None, 'Tech News', 'https://example.com/feed')
+        ])
+
+        digest = content_service.get_personalized_digest(
+            self.sample_user_id, limit=10000, offset=0
+        )
+
+        mock_conn.cursor.assert_called_once_with(name='articles_stream')
+        assert mock_cursor.itersize == content_service.STREAM_ITERSIZE
+        mock_cursor.fetchall.assert_not_called()
+        assert digest[1]['title'] == 'Test Article'
+
     @patch('src.services.content_service.get_db_connection')
     @patch('src.services.content_service.close_db_connection')
     def test_get_articles_by_topics(self, mock_close_conn, mock_get_conn):
@@ -341,6 +358,24 @@ class TestContentService:
         assert digest[0]['instruction']  # First item is instruction
         assert digest[1]['title'] == 'General Article'
 
+    @patch('src.services.content_service.get_db_connection')
+    @patch('src.services.content_service.close_db_connection')
+    def test_get_general_digest_keyset_pagination(self, mock_close_conn, mock_get_conn):
+        """Test deep pages resume from a (published_at, id) cursor instead of OFFSET"""
+        mock_conn = Mock()
+        mock_cursor = Mock()
+        mock_get_conn.return_value = mock_conn
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
+        last_seen = (datetime(2024, 1, 1, 12, 0, 0), 42)
+
+        content_service.get_general_digest(limit=10, before=last_seen)
+
+        query, params = mock_cursor.execute.call_args[0]
+        assert 'OFFSET' not in query
+        assert '(c.published_at, c.id) < (%s, %s)' in query
+        assert params == (last_seen[0], 42, 10)
+
     def test_generate_excerpt(self):
         """Test excerpt generation from content"""
         long_summary = "This is a very long summary that should be truncated to a reasonable length for display purposes. " * 5
@@ -356,3 +391,13 @@ class TestContentService:
         
         assert excerpt == short_summary
         assert not excerpt.endswith('...')
+
+    def test_clean_html_summary_with_xml_declaration(self):
+        """Test summaries carrying an encoding declaration are still cleaned"""
+        summary = '<?xml version="1.0" encoding="iso-8859-1"?><p>Café &amp; code</p>'
+        
+        assert content_service.clean_html_summary(summary) == 'Café & code'
+
+    def test_clean_html_summary_keeps_cdata_text(self):
+        """Test text inside CDATA sections survives cleaning"""
+        assert content_service.clean_html_summary('<p><![CDATA[hi]]></p>') == 'hi'
@@ -9,78 +9,95 @@ Tests all functions in the source service including:
 """
 
 import pytest
-import sys
-import os
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
+from types import MappingProxyType, SimpleNamespace
 import feedparser
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from src.services import source_service
 
+# Fixed timestamp for mocked rows, so tests stay deterministic
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# psycopg2 connection/cursor surface the service uses; the mocks reject anything else
+_CONN_ATTRS = ('cursor', 'commit', 'rollback', 'close')
+_CURSOR_ATTRS = ('execute', 'fetchone', 'fetchall', 'close', 'rowcount')
+
+# Parsed feeds returned by the mocked feedparser.parse; tests only read them
+_FEED_OK = feedparser.FeedParserDict(status=200, entries=[
+    feedparser.FeedParserDict(
+        title='Test Article',
+        link='https://example.com/article1',
+        summary='Test summary',
+        published_parsed=(2023, 1, 15, 12, 0, 0, 0, 0, 0)
+    )
+])
+_FEED_NOT_FOUND = feedparser.FeedParserDict(status=404, entries=[])
+
+# sources rows shared by the lookup tests
+_TECHCRUNCH_ROW = (1, 'TechCrunch', 'https://techcrunch.com/feed/', 'Tech news', 'Technology', True, _FROZEN_NOW)
+_ARS_TECHNICA_ROW = (2, 'Ars Technica', 'https://arstechnica.com/feed/', 'Tech articles', 'Technology', True, _FROZEN_NOW)
+
+
+@pytest.fixture
+def db_mocks(monkeypatch):
+    """Swap the source service's database helpers for a connection mock wired to its cursor"""
+    conn = Mock(spec_set=_CONN_ATTRS)
+    cursor = Mock(spec_set=_CURSOR_ATTRS)
+    conn.cursor.return_value = cursor
+    get_conn = Mock(return_value=conn)
+    close_conn = Mock()
+    monkeypatch.setattr(source_service, 'get_db_connection', get_conn)
+    monkeypatch.setattr(source_service, 'close_db_connection', close_conn)
+    return SimpleNamespace(conn=conn, cursor=cursor, get_conn=get_conn, close_conn=close_conn)
+
+
+def _assert_connections_closed(db_mocks):
+    """Assert every connection the service opened was closed again"""
+    assert db_mocks.close_conn.call_count == db_mocks.get_conn.call_count
+
 
 class TestSourceService:
     """Test class for source service functions"""
 
-    def setup_method(self):
-        """Setup test data for each test method"""
-        self.sample_source_data = {
-            'name': 'TechCrunch',
-            'url': 'https://techcrunch.com/feed/',
-            'description': 'Technology news and startup information',
-            'category': 'Technology',
-            'is_active': True
-        }
-        self.sample_source_id = 1
-
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_create_source_success(self, mock_close_conn, mock_get_conn):
+    # Shared, read-only test data; copy with dict() before mutating
+    SAMPLE_SOURCE_DATA = MappingProxyType({
+        'name': 'TechCrunch',
+        'url': 'https://techcrunch.com/feed/',
+        'description': 'Technology news and startup information',
+        'category': 'Technology',
+        'is_active': True
+    })
+    SAMPLE_SOURCE_ID = 1
+
+    def test_create_source_success(self, db_mocks):
         """Test successful source creation"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = [self.sample_source_id]
+        db_mocks.cursor.fetchone.return_value = [self.SAMPLE_SOURCE_ID]
         
-        result = source_service.create_source(**self.sample_source_data)
+        result = source_service.create_source(**self.SAMPLE_SOURCE_DATA)
         
-        assert result == self.sample_source_id
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
+        assert result == self.SAMPLE_SOURCE_ID
+        db_mocks.cursor.execute.assert_called()
+        db_mocks.conn.commit.assert_called()
+        _assert_connections_closed(db_mocks)
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_create_source_duplicate_url(self, mock_close_conn, mock_get_conn):
+    def test_create_source_duplicate_url(self, db_mocks):
         """Test source creation with duplicate URL"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
         # Simulate unique violation
         from psycopg2 import errors as pg_errors
-        mock_cursor.execute.side_effect = pg_errors.UniqueViolation("duplicate url")
+        db_mocks.cursor.execute.side_effect = pg_errors.UniqueViolation("duplicate url")
         
-        result = source_service.create_source(**self.sample_source_data)
+        result = source_service.create_source(**self.SAMPLE_SOURCE_DATA)
         
         assert result is None
-        mock_conn.rollback.assert_called()
+        db_mocks.conn.rollback.assert_called()
+        _assert_connections_closed(db_mocks)
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_get_all_sources(self, mock_close_conn, mock_get_conn):
+    def test_get_all_sources(self, db_mocks):
         """Test retrieving all sources"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        mock_cursor.fetchall.return_value = [
-            (1, 'TechCrunch', 'https://techcrunch.com/feed/', 'Tech news', 'Technology', True, datetime.now()),
-            (2, 'Ars Technica', 'https://arstechnica.com/feed/', 'Tech articles', 'Technology', True, datetime.now())
+        db_mocks.cursor.fetchall.return_value = [
+            _TECHCRUNCH_ROW,
+            _ARS_TECHNICA_ROW
         ]
         
         sources = source_service.get_all_sources()
@@ -88,110 +105,61 @@ class TestSourceService:
         assert len(sources) == 2
         assert sources[0]['name'] == 'TechCrunch'
         assert sources[1]['name'] == 'Ars Technica'
-        mock_cursor.execute.assert_called()
+        db_mocks.cursor.execute.assert_called()
+        _assert_connections_closed(db_mocks)
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_get_active_sources(self, mock_close_conn, mock_get_conn):
+    def test_get_active_sources(self, db_mocks):
         """Test retrieving only active sources"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        mock_cursor.fetchall.return_value = [
-            (1, 'TechCrunch', 'https://techcrunch.com/feed/', 'Tech news', 'Technology', True, datetime.now())
+        db_mocks.cursor.fetchall.return_value = [
+            _TECHCRUNCH_ROW
         ]
         
         sources = source_service.get_active_sources()
         
         assert len(sources) == 1
         assert sources[0]['is_active'] is True
-        mock_cursor.execute.assert_called()
+        db_mocks.cursor.execute.assert_called()
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_get_source_by_id_success(self, mock_close_conn, mock_get_conn):
+    def test_get_source_by_id_success(self, db_mocks):
         """Test retrieving source by ID"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        mock_cursor.fetchone.return_value = (
-            1, 'TechCrunch', 'https://techcrunch.com/feed/', 
-            'Tech news', 'Technology', True, datetime.now()
-        )
+        db_mocks.cursor.fetchone.return_value = _TECHCRUNCH_ROW
         
         source = source_service.get_source_by_id(1)
         
         assert source is not None
         assert source['id'] == 1
         assert source['name'] == 'TechCrunch'
+        _assert_connections_closed(db_mocks)
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_get_source_by_id_not_found(self, mock_close_conn, mock_get_conn):
+    def test_get_source_by_id_not_found(self, db_mocks):
         """Test retrieving non-existent source by ID"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = None
+        db_mocks.cursor.fetchone.return_value = None
         
         source = source_service.get_source_by_id(999)
         
         assert source is None
+        _assert_connections_closed(db_mocks)
+
+    @pytest.mark.parametrize("func_name,args,kwargs", [
+        ('update_source', (SAMPLE_SOURCE_ID,), {'name': 'Updated TechCrunch', 'description': 'Updated description'}),
+        ('delete_source', (SAMPLE_SOURCE_ID,), {}),
+        ('update_source_last_fetched', (SAMPLE_SOURCE_ID,), {}),
+        ('disable_source', (SAMPLE_SOURCE_ID,), {}),
+        ('enable_source', (SAMPLE_SOURCE_ID,), {}),
+    ])
+    def test_write_success(self, db_mocks, func_name, args, kwargs):
+        """Test source updates and deletion report success and commit"""
+        result = getattr(source_service, func_name)(*args, **kwargs)
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_update_source_success(self, mock_close_conn, mock_get_conn):
-        """Test successful source update"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        update_data = {
-            'name': 'Updated TechCrunch',
-            'description': 'Updated description'
-        }
-        
-        result = source_service.update_source(self.sample_source_id, **update_data)
-        
         assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
-
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_delete_source_success(self, mock_close_conn, mock_get_conn):
-        """Test successful source deletion"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        result = source_service.delete_source(self.sample_source_id)
-        
-        assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
+        db_mocks.cursor.execute.assert_called()
+        db_mocks.conn.commit.assert_called()
+        _assert_connections_closed(db_mocks)
 
     @patch('feedparser.parse')
     def test_fetch_rss_feed_success(self, mock_feedparser):
         """Test successful RSS feed fetching"""
-        mock_feed = Mock()
-        mock_feed.status = 200
-        mock_feed.entries = [
-            Mock(
-                title='Test Article',
-                link='https://example.com/article1',
-                summary='Test summary',
-                published_parsed=(2023, 1, 15, 12, 0, 0, 0, 0, 0)
-            )
-        ]
-        mock_feedparser.return_value = mock_feed
+        mock_feedparser.return_value = _FEED_OK
         
         feed_data = source_service.fetch_rss_feed('https://example.com/feed')
         
@@ -202,10 +170,7 @@ class TestSourceService:
     @patch('feedparser.parse')
     def test_fetch_rss_feed_failure(self, mock_feedparser):
         """Test RSS feed fetching failure"""
-        mock_feed = Mock()
-        mock_feed.status = 404
-        mock_feed.entries = []
-        mock_feedparser.return_value = mock_feed
+        mock_feedparser.return_value = _FEED_NOT_FOUND
         
         feed_data = source_service.fetch_rss_feed('https://example.com/invalid-feed')
         
@@ -231,7 +196,7 @@ class TestSourceService:
             )
         ]
         
-        articles = source_service.parse_feed_entries(mock_entries, self.sample_source_id)
+        articles = source_service.parse_feed_entries(mock_entries, self.SAMPLE_SOURCE_ID)
         
         assert len(articles) == 2
         assert articles[0].title == 'AI Breakthrough'
@@ -263,74 +228,22 @@ class TestSourceService:
         for url in invalid_urls:
             assert source_service.validate_rss_url(url) is False
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_update_source_last_fetched(self, mock_close_conn, mock_get_conn):
-        """Test updating source last fetched timestamp"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        result = source_service.update_source_last_fetched(self.sample_source_id)
-        
-        assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
-
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_get_source_statistics(self, mock_close_conn, mock_get_conn):
+    def test_get_source_statistics(self, db_mocks):
         """Test retrieving source statistics"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
         # Mock multiple fetchone calls for different stats
-        mock_cursor.fetchone.side_effect = [
+        db_mocks.cursor.fetchone.side_effect = [
             [50],  # total articles
             [10],  # articles today
-            [datetime.now()]  # last fetch
+            [_FROZEN_NOW]  # last fetch
         ]
         
-        stats = source_service.get_source_statistics(self.sample_source_id)
+        stats = source_service.get_source_statistics(self.SAMPLE_SOURCE_ID)
         
         assert 'total_articles' in stats
         assert 'articles_today' in stats
         assert 'last_fetch' in stats
         assert stats['total_articles'] == 50
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_disable_source(self, mock_close_conn, mock_get_conn):
-        """Test disabling a source"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        result = source_service.disable_source(self.sample_source_id)
-        
-        assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
-
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_enable_source(self, mock_close_conn, mock_get_conn):
-        """Test enabling a source"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        result = source_service.enable_source(self.sample_source_id)
-        
-        assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
-
     def test_extract_image_from_entry_with_image(self):
         """Test extracting image URL from feed entry"""
         mock_entry = Mock()
@@ -378,46 +291,27 @@ class TestSourceService:
         assert truncated == short_summary
         assert not truncated.endswith('...')
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_check_source_url_exists_true(self, mock_close_conn, mock_get_conn):
+    def test_check_source_url_exists_true(self, db_mocks):
         """Test checking if source URL exists (returns True)"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = [1]
+        db_mocks.cursor.fetchone.return_value = [1]
         
         exists = source_service.check_source_url_exists('https://techcrunch.com/feed/')
         
         assert exists is True
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_check_source_url_exists_false(self, mock_close_conn, mock_get_conn):
+    def test_check_source_url_exists_false(self, db_mocks):
         """Test checking if source URL exists (returns False)"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = None
+        db_mocks.cursor.fetchone.return_value = None
         
         exists = source_service.check_source_url_exists('https://nonexistent.com/feed/')
         
         assert exists is False
 
-    @patch('src.services.source_service.get_db_connection')
-    @patch('src.services.source_service.close_db_connection')
-    def test_get_sources_by_category(self, mock_close_conn, mock_get_conn):
+    def test_get_sources_by_category(self, db_mocks):
         """Test retrieving sources by category"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        mock_cursor.fetchall.return_value = [
-            (1, 'TechCrunch', 'https://techcrunch.com/feed/', 'Tech news', 'Technology', True, datetime.now()),
-            (2, 'Ars Technica', 'https://arstechnica.com/feed/', 'Tech articles', 'Technology', True, datetime.now())
+        db_mocks.cursor.fetchall.return_value = [
+            _TECHCRUNCH_ROW,
+            _ARS_TECHNICA_ROW
         ]
         
         sources = source_service.get_sources_by_category('Technology')
@@ -10,426 +10,304 @@ Tests all functions in the user service including:
 """
 
 import pytest
-import sys
-import os
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
-import bcrypt
 import pyotp
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from src.services import user_service
 
+# Fixed timestamp for mocked rows, so tests stay deterministic
+_FROZEN_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+# psycopg2 connection/cursor surface the service uses; the mocks reject anything else
+_CONN_ATTRS = ('cursor', 'commit', 'rollback', 'close')
+_CURSOR_ATTRS = ('execute', 'fetchone', 'fetchall', 'close', 'rowcount')
+
+# users row as returned by the find_user_by_* queries
+_USER_ROW = (1, 'testuser', 'test@example.com', b'hashed_password', _FROZEN_NOW, None)
+
+
+@pytest.fixture(scope="session")
+def mock_factory():
+    """Factory building a connection mock already wired to its cursor"""
+    def make_db_mocks():
+        conn = Mock(spec_set=_CONN_ATTRS)
+        cursor = Mock(spec_set=_CURSOR_ATTRS)
+        conn.cursor.return_value = cursor
+        return SimpleNamespace(conn=conn, cursor=cursor)
+    return make_db_mocks
+
+
+@pytest.fixture(scope="module", autouse=True)
+def patched_bcrypt():
+    """Swap the user service's Bcrypt instance for one mock shared by the module; tests set return values"""
+    with pytest.MonkeyPatch.context() as mp:
+        bcrypt_mock = MagicMock()
+        mp.setattr(user_service, 'bcrypt', bcrypt_mock)
+        yield bcrypt_mock
+
+
+@pytest.fixture(autouse=True)
+def reset_bcrypt(patched_bcrypt):
+    """Clear the shared Bcrypt mock's return values, side effects and calls before each test"""
+    patched_bcrypt.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def db_mocks(mock_factory, monkeypatch):
+    """Swap the user service's database helpers for fresh connection/cursor mocks"""
+    mocks = mock_factory()
+    get_conn = Mock(return_value=mocks.conn)
+    close_conn = Mock()
+    monkeypatch.setattr(user_service, 'get_db_connection', get_conn)
+    monkeypatch.setattr(user_service, 'close_db_connection', close_conn)
+    mocks.get_conn = get_conn
+    mocks.close_conn = close_conn
+    return mocks
+
+
+def _assert_connections_closed(db_mocks):
+    """Assert every connection the service opened was closed again"""
+    assert db_mocks.close_conn.call_count == db_mocks.get_conn.call_count
+
 
 class TestUserService:
     """Test class for user service functions"""
 
-    def setup_method(self):
-        """Setup test data for each test method"""
-        self.sample_user_data = {
-            'username': 'testuser',
-            'email': 'test@example.com',
-            'password': 'TestPassword123!',
-            'first_name': 'Test',
-            'last_name': 'User'
-        }
-        self.sample_user_id = 1
-
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_create_user_success(self, mock_close_conn, mock_get_conn):
+    # Shared, read-only test data; copy with dict() before mutating
+    SAMPLE_USER_DATA = MappingProxyType({
+        'username': 'testuser',
+        'email': 'test@example.com',
+        'password': 'TestPassword123!',
+        'first_name': 'Test',
+        'last_name': 'User'
+    })
+    SAMPLE_USER_ID = 1
+
+    @staticmethod
+    def _assert_db_write(db_mocks):
+        """Assert a statement was executed, the transaction committed and the connection closed"""
+        db_mocks.cursor.execute.assert_called()
+        db_mocks.conn.commit.assert_called()
+        _assert_connections_closed(db_mocks)
+
+    def test_create_user_success(self, patched_bcrypt, db_mocks):
         """Test successful user creation"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = [self.sample_user_id]
+        patched_bcrypt.generate_password_hash.return_value = b'hashed_password'
+        db_mocks.cursor.fetchone.return_value = [self.SAMPLE_USER_ID]
         
-        with patch('bcrypt.hashpw') as mock_hash:
-            mock_hash.return_value = b'hashed_password'
-            result = user_service.create_user(**self.sample_user_data)
+        result = user_service.create_user(**self.SAMPLE_USER_DATA)
             
-        assert result == self.sample_user_id
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
+        assert result == self.SAMPLE_USER_ID
+        self._assert_db_write(db_mocks)
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_create_user_duplicate_email(self, mock_close_conn, mock_get_conn):
+    def test_create_user_duplicate_email(self, patched_bcrypt, db_mocks):
         """Test user creation with duplicate email"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
+        patched_bcrypt.generate_password_hash.return_value = b'hashed_password'
         # Simulate unique violation
         from psycopg2 import errors as pg_errors
-        mock_cursor.execute.side_effect = pg_errors.UniqueViolation("duplicate email")
+        db_mocks.cursor.execute.side_effect = pg_errors.UniqueViolation("duplicate email")
         
-        with patch('bcrypt.hashpw') as mock_hash:
-            mock_hash.return_value = b'hashed_password'
-            result = user_service.create_user(**self.sample_user_data)
+        result = user_service.create_user(**self.SAMPLE_USER_DATA)
             
         assert result is None
-        mock_conn.rollback.assert_called()
+        db_mocks.conn.rollback.assert_called()
+        _assert_connections_closed(db_mocks)
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_authenticate_user_success(self, mock_close_conn, mock_get_conn):
+    def test_authenticate_user_success(self, patched_bcrypt, db_mocks):
         """Test successful user authentication"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        hashed_password = bcrypt.hashpw('TestPassword123!'.encode('utf-8'), bcrypt.gensalt())
-        mock_cursor.fetchone.return_value = (self.sample_user_id, hashed_password)
+        db_mocks.cursor.fetchone.return_value = (self.SAMPLE_USER_ID, b'x')
+        patched_bcrypt.check_password_hash.return_value = True
         
         result = user_service.authenticate_user('test@example.com', 'TestPassword123!')
         
-        assert result == self.sample_user_id
-        mock_cursor.execute.assert_called()
+        assert result == self.SAMPLE_USER_ID
+        db_mocks.cursor.execute.assert_called()
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_authenticate_user_wrong_password(self, mock_close_conn, mock_get_conn):
+    def test_authenticate_user_wrong_password(self, patched_bcrypt, db_mocks):
         """Test authentication with wrong password"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        hashed_password = bcrypt.hashpw('DifferentPassword'.encode('utf-8'), bcrypt.gensalt())
-        mock_cursor.fetchone.return_value = (self.sample_user_id, hashed_password)
+        db_mocks.cursor.fetchone.return_value = (self.SAMPLE_USER_ID, b'x')
+        patched_bcrypt.check_password_hash.return_value = False
         
         result = user_service.authenticate_user('test@example.com', 'WrongPassword')
         
         assert result is None
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_authenticate_user_not_found(self, mock_close_conn, mock_get_conn):
+    def test_authenticate_user_not_found(self, db_mocks):
         """Test authentication with non-existent user"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = None
+        db_mocks.cursor.fetchone.return_value = None
         
         result = user_service.authenticate_user('nonexistent@example.com', 'password')
         
         assert result is None
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_get_user_by_id_success(self, mock_close_conn, mock_get_conn):
+    def test_get_user_by_id_success(self, db_mocks):
         """Test retrieving user by ID"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        mock_cursor.fetchone.return_value = (
-            self.sample_user_id, 'testuser', 'test@example.com', 
-            'Test', 'User', datetime.now(), None
+        db_mocks.cursor.fetchone.return_value = (
+            self.SAMPLE_USER_ID, 'testuser', 'test@example.com', 
+            'Test', 'User', _FROZEN_NOW, None
         )
         
-        user = user_service.get_user_by_id(self.sample_user_id)
+        user = user_service.get_user_by_id(self.SAMPLE_USER_ID)
         
         assert user is not None
-        assert user['id'] == self.sample_user_id
+        assert user['id'] == self.SAMPLE_USER_ID
         assert user['username'] == 'testuser'
         assert user['email'] == 'test@example.com'
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_get_user_by_id_not_found(self, mock_close_conn, mock_get_conn):
+    def test_get_user_by_id_not_found(self, db_mocks):
         """Test retrieving non-existent user by ID"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = None
+        db_mocks.cursor.fetchone.return_value = None
         
         user = user_service.get_user_by_id(999)
         
         assert user is None
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_update_user_password_success(self, mock_close_conn, mock_get_conn):
+    @pytest.mark.parametrize("lookup,column,arg,row", [
+        (user_service.find_user_by_id, 'id', 1, _USER_ROW),
+        (user_service.find_user_by_id, 'id', 999, None),
+        (user_service.find_user_by_username, 'username', 'testuser', _USER_ROW),
+        (user_service.find_user_by_username, 'username', 'nouser', None),
+        (user_service.find_user_by_email, 'email', 'test@example.com', _USER_ROW),
+        (user_service.find_user_by_email, 'email', 'noemail@example.com', None),
+    ])
+    def test_find_user_by(self, db_mocks, lookup, column, arg, row):
+        """Test looking users up by id, username and email"""
+        db_mocks.cursor.fetchone.return_value = row
+
+        user = lookup(arg)
+
+        query, params = db_mocks.cursor.execute.call_args.args
+        assert f"WHERE {column} = %s" in query
+        assert params == (arg,)
+        if row is None:
+            assert user is None
+        else:
+            assert getattr(user, column) == arg
+        _assert_connections_closed(db_mocks)
+
+    def test_update_user_password_success(self, patched_bcrypt, db_mocks):
         """Test successful password update"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        with patch('bcrypt.hashpw') as mock_hash:
-            mock_hash.return_value = b'new_hashed_password'
-            result = user_service.update_user_password(
-                self.sample_user_id, 'NewPassword123!'
-            )
-            
-        assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
-
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_update_user_email_success(self, mock_close_conn, mock_get_conn):
-        """Test successful email update"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
+        patched_bcrypt.generate_password_hash.return_value = b'new_hashed_password'
         
-        result = user_service.update_user_email(
-            self.sample_user_id, 'newemail@example.com'
+        result = user_service.update_user_password(
+            self.SAMPLE_USER_ID, 'NewPassword123!'
         )
-        
+            
         assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
-
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_update_user_profile_success(self, mock_close_conn, mock_get_conn):
-        """Test successful profile update"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        result = user_service.update_user_profile(
-            self.sample_user_id, 
-            username='newusername',
-            first_name='NewFirst',
-            last_name='NewLast'
-        )
-        
+        self._assert_db_write(db_mocks)
+
+    @pytest.mark.parametrize("func_name,args,kwargs", [
+        ('update_user_email', (SAMPLE_USER_ID, 'newemail@example.com'), {}),
+        ('update_user_profile', (SAMPLE_USER_ID,),
+         {'username': 'newusername', 'first_name': 'NewFirst', 'last_name': 'NewLast'}),
+        ('update_user_topics', (SAMPLE_USER_ID, ['AI & ML', 'Data Science & Analytics']), {}),
+        ('delete_user', (SAMPLE_USER_ID,), {}),
+    ])
+    def test_write_success(self, db_mocks, func_name, args, kwargs):
+        """Test user updates and deletion report success and commit"""
+        result = getattr(user_service, func_name)(*args, **kwargs)
+
         assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
+        self._assert_db_write(db_mocks)
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_setup_totp_secret(self, mock_close_conn, mock_get_conn):
+    @patch('pyotp.random_base32', return_value='TESTSECRET123456')
+    def test_setup_totp_secret(self, mock_random, db_mocks):
         """Test TOTP secret setup"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        with patch('pyotp.random_base32') as mock_random:
-            mock_random.return_value = 'TESTSECRET123456'
-            secret = user_service.setup_totp_secret(self.sample_user_id)
+        secret = user_service.setup_totp_secret(self.SAMPLE_USER_ID)
             
         assert secret == 'TESTSECRET123456'
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
+        self._assert_db_write(db_mocks)
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_verify_totp_success(self, mock_close_conn, mock_get_conn):
+    @patch('pyotp.TOTP')
+    def test_verify_totp_success(self, mock_totp_class, db_mocks):
         """Test successful TOTP verification"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
+        db_mocks.cursor.fetchone.return_value = ['TESTSECRET123456']
+        mock_totp_class.return_value.verify.return_value = True
         
-        mock_cursor.fetchone.return_value = ['TESTSECRET123456']
-        
-        with patch('pyotp.TOTP') as mock_totp_class:
-            mock_totp = Mock()
-            mock_totp.verify.return_value = True
-            mock_totp_class.return_value = mock_totp
-            
-            result = user_service.verify_totp(self.sample_user_id, '123456')
+        result = user_service.verify_totp(self.SAMPLE_USER_ID, '123456')
             
         assert result is True
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_verify_totp_failure(self, mock_close_conn, mock_get_conn):
+    @patch('pyotp.TOTP')
+    def test_verify_totp_failure(self, mock_totp_class, db_mocks):
         """Test failed TOTP verification"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        mock_cursor.fetchone.return_value = ['TESTSECRET123456']
+        db_mocks.cursor.fetchone.return_value = ['TESTSECRET123456']
+        mock_totp_class.return_value.verify.return_value = False
         
-        with patch('pyotp.TOTP') as mock_totp_class:
-            mock_totp = Mock()
-            mock_totp.verify.return_value = False
-            mock_totp_class.return_value = mock_totp
-            
-            result = user_service.verify_totp(self.sample_user_id, '000000')
+        result = user_service.verify_totp(self.SAMPLE_USER_ID, '000000')
             
         assert result is False
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_get_user_topics_success(self, mock_close_conn, mock_get_conn):
+    def test_get_user_topics_success(self, db_mocks):
         """Test retrieving user topics"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        mock_cursor.fetchall.return_value = [
+        db_mocks.cursor.fetchall.return_value = [
             ('AI & ML',), 
             ('Cybersecurity & Privacy',),
             ('Cloud Computing & DevOps',)
         ]
         
-        topics = user_service.get_user_topics(self.sample_user_id)
+        topics = user_service.get_user_topics(self.SAMPLE_USER_ID)
         
         assert len(topics) == 3
         assert 'AI & ML' in topics
         assert 'Cybersecurity & Privacy' in topics
+        _assert_connections_closed(db_mocks)
+
+    @pytest.mark.parametrize("fetch_result,expected", [([1], True), (None, False)])
+    def test_check_email_exists(self, db_mocks, fetch_result, expected):
+        """Test checking if email exists"""
+        db_mocks.cursor.fetchone.return_value = fetch_result
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_update_user_topics_success(self, mock_close_conn, mock_get_conn):
-        """Test updating user topics"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        new_topics = ['AI & ML', 'Data Science & Analytics']
-        
-        result = user_service.update_user_topics(self.sample_user_id, new_topics)
-        
-        assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
-
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_check_email_exists_true(self, mock_close_conn, mock_get_conn):
-        """Test checking if email exists (returns True)"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = [1]
-        
         exists = user_service.check_email_exists('test@example.com')
-        
-        assert exists is True
-
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_check_email_exists_false(self, mock_close_conn, mock_get_conn):
-        """Test checking if email exists (returns False)"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = None
-        
-        exists = user_service.check_email_exists('nonexistent@example.com')
-        
-        assert exists is False
-
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_check_username_exists_true(self, mock_close_conn, mock_get_conn):
-        """Test checking if username exists (returns True)"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = [1]
-        
+
+        assert exists is expected
+
+    @pytest.mark.parametrize("fetch_result,expected", [([1], True), (None, False)])
+    def test_check_username_exists(self, db_mocks, fetch_result, expected):
+        """Test checking if username exists"""
+        db_mocks.cursor.fetchone.return_value = fetch_result
+
         exists = user_service.check_username_exists('testuser')
-        
-        assert exists is True
-
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_check_username_exists_false(self, mock_close_conn, mock_get_conn):
-        """Test checking if username exists (returns False)"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        mock_cursor.fetchone.return_value = None
-        
-        exists = user_service.check_username_exists('nonexistentuser')
-        
-        assert exists is False
-
-    def test_validate_password_strength_valid(self):
-        """Test password strength validation with valid password"""
-        valid_passwords = [
-            'TestPassword123!',
-            'MySecure@Pass456',
-            'Complex$Password789'
-        ]
-        
-        for password in valid_passwords:
-            is_valid, message = user_service.validate_password_strength(password)
-            assert is_valid is True
-            assert message == "Password is strong"
-
-    def test_validate_password_strength_too_short(self):
-        """Test password strength validation with short password"""
-        is_valid, message = user_service.validate_password_strength('Short1!')
-        assert is_valid is False
-        assert "at least 8 characters" in message
-
-    def test_validate_password_strength_no_uppercase(self):
-        """Test password strength validation without uppercase"""
-        is_valid, message = user_service.validate_password_strength('lowercase123!')
-        assert is_valid is False
-        assert "uppercase letter" in message
-
-    def test_validate_password_strength_no_lowercase(self):
-        """Test password strength validation without lowercase"""
-        is_valid, message = user_service.validate_password_strength('UPPERCASE123!')
-        assert is_valid is False
-        assert "lowercase letter" in message
-
-    def test_validate_password_strength_no_digit(self):
-        """Test password strength validation without digit"""
-        is_valid, message = user_service.validate_password_strength('Password!')
-        assert is_valid is False
-        assert "digit" in message
-
-    def test_validate_password_strength_no_special(self):
-        """Test password strength validation without special character"""
-        is_valid, message = user_service.validate_password_strength('Password123')
-        assert is_valid is False
-        assert "special character" in message
-
-    def test_validate_email_format_valid(self):
-        """Test email format validation with valid emails"""
-        valid_emails = [
-            'test@example.com',
-            'user.name@domain.co.uk',
-            'firstname+lastname@company.org'
-        ]
-        
-        for email in valid_emails:
-            assert user_service.validate_email_format(email) is True
 
-    def test_validate_email_format_invalid(self):
+        assert exists is expected
+
+    @pytest.mark.parametrize("pwd,expected_valid,msg_fragment", [
+        ('TestPassword123!', True, "Password is strong"),
+        ('MySecure@Pass456', True, "Password is strong"),
+        ('Complex$Password789', True, "Password is strong"),
+        ('Short1!', False, "at least 8 characters"),
+        ('lowercase123!', False, "uppercase letter"),
+        ('UPPERCASE123!', False, "lowercase letter"),
+        ('Password!', False, "digit"),
+        ('Password123', False, "special character")
+    ])
+    def test_validate_password_strength(self, pwd, expected_valid, msg_fragment):
+        """Test password strength validation"""
+        is_valid, message = user_service.validate_password_strength(pwd)
+        assert is_valid is expected_valid
+        assert msg_fragment in message
+
+    @pytest.mark.parametrize("email", [
+        'test@example.com',
+        'user.name@domain.co.uk',
+        'firstname+lastname@company.org'
+    ])
+    def test_validate_email_format_valid(self, email):
+        """Test email format validation with valid emails"""
+        assert user_service.validate_email_format(email) is True
+
+    @pytest.mark.parametrize("email", [
+        'invalid.email',
+        '@domain.com',
+        'user@',
+        'user name@domain.com',
+        'user@domain'
+    ])
+    def test_validate_email_format_invalid(self, email):
         """Test email format validation with invalid emails"""
-        invalid_emails = [
-            'invalid.email',
-            '@domain.com',
-            'user@',
-            'user name@domain.com',
-            'user@domain'
-        ]
-        
-        for email in invalid_emails:
-            assert user_service.validate_email_format(email) is False
+        assert user_service.validate_email_format(email) is False
 
     def test_sanitize_input(self):
         """Test input sanitization"""
@@ -439,38 +317,16 @@ class TestUserService:
         assert '<script>' not in clean_input
         assert 'Hello World' in clean_input
 
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_delete_user_success(self, mock_close_conn, mock_get_conn):
-        """Test successful user deletion"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
-        result = user_service.delete_user(self.sample_user_id)
-        
-        assert result is True
-        mock_cursor.execute.assert_called()
-        mock_conn.commit.assert_called()
-
-    @patch('src.services.user_service.get_db_connection')
-    @patch('src.services.user_service.close_db_connection')
-    def test_get_user_statistics(self, mock_close_conn, mock_get_conn):
+    def test_get_user_statistics(self, db_mocks):
         """Test retrieving user statistics"""
-        mock_conn = Mock()
-        mock_cursor = Mock()
-        mock_get_conn.return_value = mock_conn
-        mock_conn.cursor.return_value = mock_cursor
-        
         # Mock multiple fetchone calls for different stats
-        mock_cursor.fetchone.side_effect = [
+        db_mocks.cursor.fetchone.side_effect = [
             [25],  # articles_read
             [10],  # articles_liked
-            [datetime.now()]  # last_activity
+            [_FROZEN_NOW]  # last_activity
         ]
         
-        stats = user_service.get_user_statistics(self.sample_user_id)
+        stats = user_service.get_user_statistics(self.SAMPLE_USER_ID)
         
         assert 'articles_read' in stats
         assert 'articles_liked' in stats
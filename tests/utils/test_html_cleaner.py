@@ -0,0 +1,135 @@
+"""
+Tests for html_cleaner.py
+
+Tests the HTML cleaning helpers including:
+- RSS summary cleaning (entities, quotes, whitespace, plain-text fast path)
+- Bleach sanitization of article content and user input
+- Plain-text extraction
+"""
+
+import threading
+
+import bleach
+import pytest
+from bs4 import BeautifulSoup
+
+from src.utils.html_cleaner import HTML_PARSER, HTMLCleaner, clean_html_summary
+
+
+_CONTENT_SAMPLES = (
+    '<p onclick="x()">Hello <b>world</b><script>alert(1)</script></p>',
+    '<a href="https://example.com" target="_blank">link</a><img src="a.png" alt="A" onerror="x">',
+    '<div class="note"><iframe src="evil"></iframe><pre class="py"><code>x = 1</code></pre></div>',
+    '<p><![CDATA[kept]]></p><table><tr><td>cell</td></tr></table>',
+)
+
+_USER_SAMPLES = (
+    '<p>Nice <strong>post</strong> <a href="https://spam.example">click</a></p>',
+    '<em>hi</em><img src="x.png"><h1>big</h1>',
+    '<b onmouseover="x()">bold</b>',
+)
+
+
+class TestCleanHtmlSummary:
+    """Test RSS summary cleaning"""
+
+    def test_double_escaped_entities_are_decoded(self):
+        """Test entities escaped twice by the feed are fully decoded"""
+        assert clean_html_summary('AT&amp;amp;T earnings') == 'AT&T earnings'
+        assert clean_html_summary('<p>AT&amp;amp;T earnings</p>') == 'AT&T earnings'
+
+    def test_straight_quotes_next_to_whitespace(self):
+        """Test removing quotes leaves no doubled or trailing spaces"""
+        assert clean_html_summary('<p>He said " hi " there </p>') == 'He said hi there'
+        assert clean_html_summary("It's  a\t 'plain'   summary ") == 'Its a plain summary'
+
+    def test_smart_quotes_are_kept(self):
+        """Test typographic quotes survive; only straight quotes are stripped"""
+        assert clean_html_summary('<p>“Hello”  world</p>') == '“Hello” world'
+
+    def test_nul_characters_skip_the_fast_path(self):
+        """Test NUL bytes go through the parser, with or without markup"""
+        plain = clean_html_summary('nul\x00byte')
+
+        assert plain == clean_html_summary('<span>nul\x00byte</span>')
+        assert '\x00' not in plain
+
+    @pytest.mark.parametrize('summary', [
+        'Plain summary with no markup',
+        "  Spaced\tout \n  summary's text  ",
+        'Price: $5 (50% off)',
+    ])
+    def test_plain_text_fast_path_matches_parser(self, summary):
+        """Test the plain-text fast path gives the same result as parsing"""
+        assert clean_html_summary(summary) == clean_html_summary(f'<p>{summary}</p>')
+
+    def test_empty_summary(self):
+        """Test empty input gives an empty string"""
+        assert clean_html_summary('') == ''
+
+
+class TestHTMLCleaner:
+    """Test the HTMLCleaner sanitizer and text extraction"""
+
+    @pytest.mark.parametrize('content', _CONTENT_SAMPLES)
+    def test_clean_html_matches_bleach(self, content):
+        """Test the cached content sanitizer gives the same output as bleach.clean"""
+        cleaner = HTMLCleaner()
+        expected = bleach.clean(
+            content.replace('<![CDATA[', '').replace(']]>', ''),
+            tags=frozenset(HTMLCleaner.ALLOWED_TAGS),
+            attributes=HTMLCleaner.ALLOWED_ATTRIBUTES,
+            strip=True
+        )
+
+        assert cleaner.clean_html(content) == expected
+        assert cleaner.clean_html(content) == expected  # Reused cleaner
+
+    @pytest.mark.parametrize('user_input', _USER_SAMPLES)
+    def test_sanitize_user_input_matches_bleach(self, user_input):
+        """Test the cached user sanitizer only keeps USER_ALLOWED_TAGS"""
+        cleaner = HTMLCleaner()
+        expected = bleach.clean(
+            user_input,
+            tags=frozenset(HTMLCleaner.USER_ALLOWED_TAGS),
+            attributes={},
+            strip=True
+        )
+
+        assert cleaner.sanitize_user_input(user_input) == expected
+        assert cleaner.sanitize_user_input(user_input) == expected  # Reused cleaner
+
+    def test_cleaners_are_per_thread(self):
+        """Test each thread sanitizes with its own bleach Cleaner"""
+        cleaner = HTMLCleaner()
+        seen = []
+
+        def worker():
+            assert cleaner.clean_html('<b>x</b><i>y</i>') == '<b>x</b><i>y</i>'
+            seen.append(id(cleaner._local.content))
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(seen)) == 4
+
+    @pytest.mark.parametrize('html_content', [
+        '  plain text  ',
+        'a line\nanother line',
+        'a line\r\nanother line',
+        '<p>Hello <b>world</b></p><ul><li>a</li><li>b</li></ul>',
+        'a &amp; b',
+        '<div>x<script>y</script></div>',
+    ])
+    def test_extract_text_matches_parser(self, html_content):
+        """Test plain text and markup extract the same as a full parse"""
+        expected = BeautifulSoup(html_content, HTML_PARSER).get_text(strip=True, separator=' ')
+
+        assert HTMLCleaner().extract_text(html_content) == expected
+
+    def test_extract_text_empty(self):
+        """Test empty input gives an empty string"""
+        assert HTMLCleaner().extract_text('') == ''